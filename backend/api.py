@@ -10,17 +10,180 @@ OpenAI Responses API.
 import time
 import logging
 import json
+import hashlib
+import signal
 import asyncio
 import aiohttp
 from aiohttp import web
 from pathlib import Path
 import importlib.resources
-from .runner import HealthStatus, HealthMessages
+from .runner import HealthStatus, HealthMessages, UPSTREAM_JSON_HEADERS
+from .json_utils import json_dumps, json_loads
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
 
+# Time-to-live for the cached /health response
+HEALTH_CACHE_TTL_SECONDS = 2.0
+
+# Largest request body accepted by the server; chat and responses payloads may
+# carry base64-encoded images
+MAX_REQUEST_BODY_BYTES = 10 * 1024 * 1024
+
+# Tighter body limits for text-only endpoints
+ENDPOINT_MAX_BODY_BYTES = {
+    "/v1/embeddings": 1024 * 1024,
+    "/v1/rerank": 1024 * 1024,
+}
+
+# Timeouts for upstream /health probes; connect and read get separate budgets
+# so a wedged runner fails fast without starving the overall deadline
+PROBE_TIMEOUT = aiohttp.ClientTimeout(total=3.0, sock_connect=1.0, sock_read=2.0)
+
+# Maximum number of upstream /health probes in flight at once
+MAX_CONCURRENT_PROBES = 32
+
+# Read buffer size for upstream responses; sized to hold several stream chunks
+UPSTREAM_READ_BUFSIZE = 256 * 1024
+
+# Byte sequences that end a server-sent event
+SSE_EVENT_TERMINATORS = (b"\n\n", b"\r\n\r\n")
+
+# Largest amount of an incomplete SSE event held back before it is written
+STREAM_FLUSH_BYTES = 32 * 1024
+
+# Read size used when static files cannot be sent with sendfile()
+STATIC_CHUNK_SIZE = 256 * 1024
+
+# Upper bound on how much of an upstream /health error body is read.
+HEALTH_BODY_MAX_BYTES = 512
+
+# Upper bound on how much of an upstream error body is relayed to the client.
+UPSTREAM_ERROR_BODY_MAX_BYTES = 64 * 1024
+
+# Preflight headers that do not depend on the request
+CORS_PREFLIGHT_HEADERS = {
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Max-Age": "86400",
+}
+CORS_DEFAULT_ALLOW_HEADERS = "Content-Type, Authorization"
+
+# (epoch second, formatted timestamp) of the last _iso_now() call
+_last_timestamp = (None, "")
+
+
+def _iso_now():
+    """Return the current UTC time as an ISO 8601 string.
+
+    The string only changes once per second, so it is cached and rebuilt
+    from the gmtime() fields instead of calling strftime() on every response.
+
+    Returns:
+        The timestamp formatted as YYYY-MM-DDTHH:MM:SSZ.
+    """
+    global _last_timestamp
+    now = int(time.time())
+    if _last_timestamp[0] != now:
+        t = time.gmtime(now)
+        _last_timestamp = (
+            now,
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z",
+        )
+    return _last_timestamp[1]
+
+
+def _json_body_response(body, status=200):
+    """Build a JSON response from an already encoded body.
+
+    Args:
+        body: The encoded JSON document as bytes.
+        status: The HTTP status code.
+
+    Returns:
+        The response.
+    """
+    return web.Response(
+        body=body,
+        status=status,
+        content_type="application/json",
+        charset="utf-8",
+    )
+
+
+# Pre-encoded bodies for error responses whose message never changes
+_ERROR_INVALID_JSON = json_dumps({"error": {"message": "Invalid JSON"}})
+_ERROR_MODEL_NOT_SPECIFIED = json_dumps({"error": {"message": "Model not specified"}})
+_ERROR_PAYLOAD_TOO_LARGE = json_dumps({"error": {"message": "Payload too large"}})
+
+
+def _compute_etag(body):
+    """Compute a strong ETag for a response body.
+
+    Args:
+        body: The response body as bytes.
+
+    Returns:
+        The quoted ETag value.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(request, etag):
+    """Check whether a request's If-None-Match header matches an ETag.
+
+    Args:
+        request: The request.
+        etag: The quoted ETag of the current representation.
+
+    Returns:
+        True if the client already has the current representation.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag or candidate == "*":
+            return True
+    return False
+
+
+def _json_response(data, status=200):
+    """Build a JSON response using the fastest available encoder.
+
+    Args:
+        data: The object to serialize.
+        status: The HTTP status code.
+
+    Returns:
+        The response.
+    """
+    return _json_body_response(json_dumps(data), status=status)
+
+
+async def _read_capped(content, limit):
+    """Read a response body up to a size limit.
+
+    Args:
+        content: The response's StreamReader.
+        limit: The maximum number of bytes to read.
+
+    Returns:
+        The body as bytes, truncated to at most limit bytes.
+    """
+    body = bytearray()
+    while len(body) < limit:
+        chunk = await content.read(limit - len(body))
+        if not chunk:
+            break
+        body += chunk
+    return bytes(body)
+
+
 class APIServer:
     """OpenAI-compatible API server with async support.
 
@@ -43,17 +206,31 @@ class APIServer:
         self.host = config_manager.get_api_host()
         self.port = config_manager.get_api_port()
         self.health_endpoint = config_manager.get_health_endpoint()
+        self.stream_chunk_bytes = config_manager.get_stream_chunk_bytes()
 
         # Get frontend directory path - try package resources first, fallback to relative path
         self.frontend_path = self._get_frontend_path()
 
+        # Render the dashboard once; it only depends on startup configuration
+        self._dashboard_body = self._load_dashboard()
+        self._dashboard_etag = (
+            _compute_etag(self._dashboard_body) if self._dashboard_body else None
+        )
+        self._dashboard_not_found_body = (
+            f"Dashboard not found at {self.frontend_path / 'index.html'}. "
+            "Please ensure the frontend folder exists with index.html."
+        ).encode("utf-8")
+
         # Load CORS configuration before building the application so the middleware
         # can be registered with the right allowlist.
         self.cors_allow_origins = config_manager.get_cors_allow_origins()
+        self._cors_allow_all = self.cors_allow_origins == ["*"]
+        self._cors_allow_origins_set = frozenset(self.cors_allow_origins or ())
+        self._preflight_headers = self._build_preflight_headers()
 
         # Set a larger client_max_size to handle image uploads (10MB should be enough)
         self.app = web.Application(
-            client_max_size=10 * 1024 * 1024,
+            client_max_size=MAX_REQUEST_BODY_BYTES,
             middlewares=[self._build_cors_middleware()],
         )
         # CORS responsibilities are split: the middleware answers preflight
@@ -71,6 +248,22 @@ class APIServer:
         self.runner = None
         self.site = None
 
+        # Shared HTTP client session for upstream probes, created in start()
+        self.http_session = None
+        self.upstream_session = None
+
+        # Cached (monotonic timestamp, encoded body) pair for /health
+        self._health_cache = None
+        self._health_lock = asyncio.Lock()
+        self._probe_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+        self._ready_inflight = {}  # Map of model alias to in-flight readiness task
+
+        # The model list only changes with the configuration, so encode it once
+        self._boot_time = int(time.time())
+        self._models_body = None
+        self._models_etag = None
+        self.invalidate_models_cache()
+
     def _get_frontend_path(self):
         """Get the path to the frontend directory.
 
@@ -92,6 +285,27 @@ class APIServer:
             logger.warning("Frontend package not found, falling back to relative path")
             return Path("frontend")
 
+    def _load_dashboard(self):
+        """Read the dashboard HTML once and inject the health endpoint.
+
+        Returns:
+            The rendered dashboard as bytes, or None if it could not be loaded.
+        """
+        dashboard_path = self.frontend_path / "index.html"
+        try:
+            content = dashboard_path.read_bytes()
+        except FileNotFoundError:
+            logger.warning(f"Dashboard not found at {dashboard_path}")
+            return None
+        except OSError as e:
+            logger.error(f"Error loading dashboard: {e}")
+            return None
+
+        # Inject the health endpoint into the dashboard
+        return content.replace(
+            b"__HEALTH_ENDPOINT__", self.health_endpoint.encode("utf-8")
+        )
+
     def _setup_routes(self):
         """Set up API routes."""
         # Only add static route if frontend path exists
@@ -115,8 +329,16 @@ class APIServer:
 
         # Add static route if frontend path exists
         if self.frontend_path.exists() and self.frontend_path.is_dir():
+            # Files are streamed with sendfile() where the platform allows it;
+            # directory listings are not needed by the dashboard
             routes.append(
-                web.static("/frontend", str(self.frontend_path), show_index=True)
+                web.static(
+                    "/frontend",
+                    str(self.frontend_path),
+                    show_index=False,
+                    follow_symlinks=False,
+                    chunk_size=STATIC_CHUNK_SIZE,
+                )
             )
             logger.info(f"Serving static files from: {self.frontend_path}")
         else:
@@ -134,9 +356,36 @@ class APIServer:
             logger.info(f"Starting API server on {self.host}:{self.port}")
             logger.info(f"Keepalive timeout set to {self.keepalive_timeout} seconds")
 
-            self.runner = web.AppRunner(
-                self.app, keepalive_timeout=self.keepalive_timeout
+            # Reuse one pooled session for all upstream probes instead of
+            # opening a new connection per model on every /health poll
+            self.http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64, limit_per_host=16, keepalive_timeout=30
+                ),
+                timeout=PROBE_TIMEOUT,
+            )
+
+            # Long-lived pool for forwarding streaming requests to the runners,
+            # so each stream reuses a kept-alive connection. Timeouts are set
+            # per request from the streaming timeout configuration.
+            # aiohttp enables TCP_NODELAY on every client and server
+            # connection, so SSE events are not held back by Nagle; socket
+            # buffer sizes are left to the kernel's autotuning. There is no
+            # connection cap, so concurrent streams queue in the runner
+            # rather than in the pool.
+            self.upstream_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=0, keepalive_timeout=75, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=None),
+                read_bufsize=UPSTREAM_READ_BUFSIZE,
             )
+
+            # Per-request access log lines are only written in debug mode
+            runner_kwargs = {"keepalive_timeout": self.keepalive_timeout}
+            if not logger.isEnabledFor(logging.DEBUG):
+                runner_kwargs["access_log"] = None
+            self.runner = web.AppRunner(self.app, **runner_kwargs)
             await self.runner.setup()
             self.site = web.TCPSite(self.runner, self.host, self.port)
             await self.site.start()
@@ -161,11 +410,20 @@ class APIServer:
             # Stop auto-unload watchdog first
             await self.runner_manager.stop_auto_unload_watchdog()
 
+            if self.http_session is not None:
+                await self.http_session.close()
+                self.http_session = None
+
             if self.runner:
                 logger.info("Stopping API server")
                 await self.runner.cleanup()
                 logger.info("API server stopped successfully")
 
+            # Closed after the runner so in-flight streams can finish first
+            if self.upstream_session is not None:
+                await self.upstream_session.close()
+                self.upstream_session = None
+
             return True
 
         except Exception as e:
@@ -192,7 +450,9 @@ class APIServer:
                 runner.active_requests += 1
                 runner.last_activity_ts = time.time()
                 logger.debug(
-                    f"Request started for model {model_alias}, active requests: {runner.active_requests}"
+                    "Request started for model %s, active requests: %d",
+                    model_alias,
+                    runner.active_requests,
                 )
 
     async def _notify_request_end(self, model_alias: str) -> None:
@@ -207,7 +467,9 @@ class APIServer:
                 runner.active_requests = max(0, runner.active_requests - 1)
                 runner.last_activity_ts = time.time()
                 logger.debug(
-                    f"Request ended for model {model_alias}, active requests: {runner.active_requests}"
+                    "Request ended for model %s, active requests: %d",
+                    model_alias,
+                    runner.active_requests,
                 )
 
     def _build_cors_middleware(self):
@@ -227,20 +489,15 @@ class APIServer:
         async def cors_middleware(request, handler):
             if request.method == "OPTIONS":
                 origin = self._resolve_cors_origin(request)
-                headers = {}
-                if origin:
-                    headers["Access-Control-Allow-Origin"] = origin
-                    if origin != "*":
-                        headers["Vary"] = "Origin"
-                    # Echo the headers the client asked to send so Authorization
-                    # (used by OpenAI-compatible clients) passes preflight.
-                    requested_headers = request.headers.get(
-                        "Access-Control-Request-Headers", "Content-Type, Authorization"
-                    )
-                    headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
-                    headers["Access-Control-Allow-Headers"] = requested_headers
-                    headers["Access-Control-Max-Age"] = "600"
-                return web.Response(status=200, headers=headers)
+                if not origin:
+                    return web.Response(status=204)
+                headers = self._preflight_headers[origin].copy()
+                # Echo the headers the client asked to send so Authorization
+                # (used by OpenAI-compatible clients) passes preflight.
+                headers["Access-Control-Allow-Headers"] = request.headers.get(
+                    "Access-Control-Request-Headers", CORS_DEFAULT_ALLOW_HEADERS
+                )
+                return web.Response(status=204, headers=headers)
 
             # Non-preflight: actual CORS header is set by on_response_prepare
             # so it also reaches the client for streaming responses.
@@ -248,15 +505,31 @@ class APIServer:
 
         return cors_middleware
 
+    def _build_preflight_headers(self):
+        """Build the static preflight headers for every allowed origin.
+
+        Returns:
+            A dictionary mapping each value _resolve_cors_origin can return to
+            the preflight headers for it, minus Access-Control-Allow-Headers.
+        """
+        origins = ["*"] if self._cors_allow_all else self._cors_allow_origins_set
+        preflight_headers = {}
+        for origin in origins:
+            headers = dict(CORS_PREFLIGHT_HEADERS)
+            headers["Access-Control-Allow-Origin"] = origin
+            if origin != "*":
+                headers["Vary"] = "Origin"
+            preflight_headers[origin] = headers
+        return preflight_headers
+
     def _resolve_cors_origin(self, request):
         """Resolve the Access-Control-Allow-Origin value for a request, or None."""
-        allow_origins = self.cors_allow_origins
-        if not allow_origins:
-            return None
-        if allow_origins == ["*"]:
+        if self._cors_allow_all:
             return "*"
+        if not self._cors_allow_origins_set:
+            return None
         request_origin = request.headers.get("Origin")
-        if request_origin and request_origin in allow_origins:
+        if request_origin in self._cors_allow_origins_set:
             return request_origin
         return None
 
@@ -273,9 +546,10 @@ class APIServer:
         response.headers["Access-Control-Allow-Origin"] = origin
         if origin != "*":
             existing_vary = response.headers.get("Vary")
-            response.headers["Vary"] = (
-                f"{existing_vary}, Origin" if existing_vary else "Origin"
-            )
+            if not existing_vary:
+                response.headers["Vary"] = "Origin"
+            elif "Origin" not in existing_vary:
+                response.headers["Vary"] = f"{existing_vary}, Origin"
 
     async def handle_dashboard(self, request):
         """Handle GET / and /dashboard requests to serve the dashboard.
@@ -286,22 +560,41 @@ class APIServer:
         Returns:
             The response.
         """
-        try:
-            dashboard_path = self.frontend_path / "index.html"
-            if dashboard_path.exists():
-                with open(dashboard_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                # Inject the health endpoint into the dashboard
-                content = content.replace("__HEALTH_ENDPOINT__", self.health_endpoint)
-                return web.Response(text=content, content_type="text/html")
-            else:
-                return web.Response(
-                    text=f"Dashboard not found at {dashboard_path}. Please ensure the frontend folder exists with index.html.",
-                    status=404,
-                )
-        except Exception as e:
-            logger.error(f"Error serving dashboard: {e}")
-            return web.Response(text=f"Error loading dashboard: {str(e)}", status=500)
+        if self._dashboard_body is None:
+            return web.Response(
+                body=self._dashboard_not_found_body,
+                status=404,
+                content_type="text/plain",
+                charset="utf-8",
+            )
+
+        headers = {"Cache-Control": "public, max-age=60", "ETag": self._dashboard_etag}
+        if _etag_matches(request, self._dashboard_etag):
+            return web.Response(status=304, headers=headers)
+
+        return web.Response(
+            body=self._dashboard_body,
+            content_type="text/html",
+            charset="utf-8",
+            headers=headers,
+        )
+
+    def invalidate_models_cache(self):
+        """Rebuild the encoded /v1/models response from the current model aliases.
+
+        Call this whenever the set of model aliases changes.
+        """
+        models = [
+            {
+                "id": alias,
+                "object": "model",
+                "created": self._boot_time,
+                "owned_by": "user",
+            }
+            for alias in self.runner_manager.get_model_aliases()
+        ]
+        self._models_body = json_dumps({"object": "list", "data": models})
+        self._models_etag = _compute_etag(self._models_body)
 
     async def handle_models(self, request):
         """Handle GET /v1/models requests.
@@ -312,156 +605,206 @@ class APIServer:
         Returns:
             The response.
         """
-        models = []
-        for alias in self.runner_manager.get_model_aliases():
-            models.append(
-                {
-                    "id": alias,
-                    "object": "model",
-                    "created": int(time.time()),
-                    "owned_by": "user",
+        if _etag_matches(request, self._models_etag):
+            return web.Response(status=304, headers={"ETag": self._models_etag})
+
+        response = _json_body_response(self._models_body)
+        response.headers["ETag"] = self._models_etag
+        return response
+
+    async def _probe_model_health(self, model_alias):
+        """Probe the health of a single model via its runner's llama.cpp /health endpoint.
+
+        Args:
+            model_alias: The alias of the model to probe.
+
+        Returns:
+            A dictionary with "status" and "message" keys.
+        """
+        try:
+            # Get runner for this model
+            runner = self.runner_manager.get_runner_for_model(model_alias)
+            if runner is None:
+                return {
+                    "status": HealthStatus.ERROR,
+                    "message": HealthMessages.NO_RUNNER_AVAILABLE,
                 }
-            )
 
-        response = {"object": "list", "data": models}
+            # Check if runner process is even running
+            if not await self.runner_manager.is_runner_running(runner.runner_name):
+                return {
+                    "status": HealthStatus.NOT_RUNNING,
+                    "message": HealthMessages.RUNNER_NOT_RUNNING,
+                }
+
+            # Check if this specific model is loaded in the runner
+            if not runner.is_model_loaded(model_alias):
+                return {
+                    "status": HealthStatus.NOT_LOADED,
+                    "message": HealthMessages.MODEL_NOT_LOADED,
+                }
 
-        return web.json_response(response)
+            # Call llama.cpp health endpoint
+            health_url = runner.health_url
+
+            try:
+                async with (
+                    self._probe_semaphore,
+                    self.http_session.get(health_url) as response,
+                ):
+                    if response.status == 200:
+                        return {
+                            "status": HealthStatus.OK,
+                            "message": HealthMessages.READY,
+                        }
+                    # Only a short snippet of the body is ever reported, so cap
+                    # the read instead of buffering whatever the upstream sends.
+                    body = await response.content.read(HEALTH_BODY_MAX_BYTES)
+                    if response.status == 503:
+                        # Parse the error response
+                        try:
+                            error_data = json_loads(body)
+                            error_message = error_data.get("error", {}).get(
+                                "message", "Unknown error"
+                            )
+                            if "loading" in error_message.lower():
+                                return {
+                                    "status": HealthStatus.LOADING,
+                                    "message": error_message,
+                                }
+                            return {
+                                "status": HealthStatus.ERROR,
+                                "message": error_message,
+                            }
+                        except (json.JSONDecodeError, AttributeError):
+                            # Fallback if JSON parsing fails
+                            error_text = body.decode("utf-8", "replace")
+                            if "loading" in error_text.lower():
+                                return {
+                                    "status": HealthStatus.LOADING,
+                                    "message": HealthMessages.MODEL_LOADING,
+                                }
+                            return {
+                                "status": HealthStatus.ERROR,
+                                "message": f"HTTP {response.status}: {error_text[:100]}",
+                            }
+                    else:
+                        # Other HTTP errors
+                        error_text = body.decode("utf-8", "replace")
+                        return {
+                            "status": HealthStatus.ERROR,
+                            "message": f"HTTP {response.status}: {error_text[:100]}",
+                        }
+
+            except asyncio.TimeoutError:
+                return {
+                    "status": HealthStatus.ERROR,
+                    "message": HealthMessages.HEALTH_CHECK_TIMEOUT,
+                }
+            except aiohttp.ClientError as e:
+                return {
+                    "status": HealthStatus.ERROR,
+                    "message": f"{HealthMessages.CONNECTION_ERROR}: {str(e)}",
+                }
+
+        except Exception as e:
+            return {
+                "status": HealthStatus.ERROR,
+                "message": f"{HealthMessages.HEALTH_CHECK_FAILED}: {str(e)}",
+            }
 
     async def handle_health(self, request):
         """Handle GET /health requests.
 
+        The response is cached for HEALTH_CACHE_TTL_SECONDS so that several
+        dashboards polling at once trigger a single round of upstream probes.
+        If rebuilding the payload fails, the last known good payload is served.
+
         Args:
             request: The request.
 
         Returns:
             The response.
         """
-        # Check which runners are active
-        active_runners = {}
-        for runner_name in self.runner_manager.get_runner_names():
-            active_runners[runner_name] = await self.runner_manager.is_runner_running(
-                runner_name
-            )
+        cached = self._health_cache
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < HEALTH_CACHE_TTL_SECONDS
+        ):
+            return _json_body_response(cached[1])
+
+        async with self._health_lock:
+            # Another request may have refreshed the cache while we waited
+            cached = self._health_cache
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < HEALTH_CACHE_TTL_SECONDS
+            ):
+                return _json_body_response(cached[1])
 
-        # Check actual model status from llama.cpp health endpoints
-        model_health = {}
-        for model_alias in self.runner_manager.get_model_aliases():
             try:
-                # Get runner for this model
-                runner = self.runner_manager.get_runner_for_model(model_alias)
-                if runner is None:
-                    model_health[model_alias] = {
-                        "status": HealthStatus.ERROR,
-                        "message": HealthMessages.NO_RUNNER_AVAILABLE,
-                    }
-                    continue
+                body = json_dumps(await self._build_health_payload())
+            except Exception as e:
+                if cached is None:
+                    raise
+                logger.warning(f"Health check failed, serving last known state: {e}")
+                return _json_body_response(cached[1])
 
-                # Check if runner process is even running
-                if not await self.runner_manager.is_runner_running(runner.runner_name):
-                    model_health[model_alias] = {
-                        "status": HealthStatus.NOT_RUNNING,
-                        "message": HealthMessages.RUNNER_NOT_RUNNING,
-                    }
-                    continue
+            self._health_cache = (time.monotonic(), body)
 
-                # Check if this specific model is loaded in the runner
-                if not runner.is_model_loaded(model_alias):
-                    model_health[model_alias] = {
-                        "status": HealthStatus.NOT_LOADED,
-                        "message": HealthMessages.MODEL_NOT_LOADED,
-                    }
-                    continue
+        return _json_body_response(body)
 
-                # Call llama.cpp health endpoint
-                health_url = f"http://{runner.host}:{runner.port}/health"
+    def _invalidate_health_cache(self):
+        """Drop the cached /health payload so the next poll sees fresh state."""
+        self._health_cache = None
 
-                async with aiohttp.ClientSession() as session:
-                    try:
-                        async with session.get(
-                            health_url, timeout=aiohttp.ClientTimeout(total=3)
-                        ) as response:
-                            if response.status == 200:
-                                model_health[model_alias] = {
-                                    "status": HealthStatus.OK,
-                                    "message": HealthMessages.READY,
-                                }
-                            elif response.status == 503:
-                                # Parse the error response
-                                try:
-                                    error_data = await response.json()
-                                    error_message = error_data.get("error", {}).get(
-                                        "message", "Unknown error"
-                                    )
-                                    if "loading" in error_message.lower():
-                                        model_health[model_alias] = {
-                                            "status": HealthStatus.LOADING,
-                                            "message": error_message,
-                                        }
-                                    else:
-                                        model_health[model_alias] = {
-                                            "status": HealthStatus.ERROR,
-                                            "message": error_message,
-                                        }
-                                except (json.JSONDecodeError, aiohttp.ContentTypeError):
-                                    # Fallback if JSON parsing fails
-                                    error_text = await response.text()
-                                    if "loading" in error_text.lower():
-                                        model_health[model_alias] = {
-                                            "status": HealthStatus.LOADING,
-                                            "message": HealthMessages.MODEL_LOADING,
-                                        }
-                                    else:
-                                        model_health[model_alias] = {
-                                            "status": HealthStatus.ERROR,
-                                            "message": f"HTTP {response.status}: {error_text[:100]}",
-                                        }
-                                except UnicodeDecodeError:
-                                    model_health[model_alias] = {
-                                        "status": HealthStatus.ERROR,
-                                        "message": f"HTTP {response.status}",
-                                    }
-                            else:
-                                # Other HTTP errors
-                                try:
-                                    error_text = await response.text()
-                                    model_health[model_alias] = {
-                                        "status": HealthStatus.ERROR,
-                                        "message": f"HTTP {response.status}: {error_text[:100]}",
-                                    }
-                                except UnicodeDecodeError:
-                                    model_health[model_alias] = {
-                                        "status": HealthStatus.ERROR,
-                                        "message": f"HTTP {response.status}",
-                                    }
-
-                    except asyncio.TimeoutError:
-                        model_health[model_alias] = {
-                            "status": HealthStatus.ERROR,
-                            "message": HealthMessages.HEALTH_CHECK_TIMEOUT,
-                        }
-                    except aiohttp.ClientError as e:
-                        model_health[model_alias] = {
-                            "status": HealthStatus.ERROR,
-                            "message": f"{HealthMessages.CONNECTION_ERROR}: {str(e)}",
-                        }
+    async def _build_health_payload(self):
+        """Probe all runners and models and assemble the /health payload.
 
-            except Exception as e:
-                model_health[model_alias] = {
+        Runner processes are checked in a single pass and model probes are
+        issued concurrently, so the time taken is bounded by the slowest probe
+        rather than the sum of all of them.
+
+        Returns:
+            The health payload as a dictionary.
+        """
+        # Bind the runner manager lookups used per runner/model to locals
+        runner_manager = self.runner_manager
+        runners = runner_manager.runners
+        get_current_model = runner_manager.get_current_model_for_runner
+        probe_model_health = self._probe_model_health
+
+        runner_names = runner_manager.get_runner_names()
+        model_aliases = runner_manager.get_model_aliases()
+
+        # Check which runners are active
+        active_runners = await runner_manager.snapshot_running()
+
+        model_results = await asyncio.gather(
+            *(probe_model_health(alias) for alias in model_aliases),
+            return_exceptions=True,
+        )
+
+        # Check actual model status from llama.cpp health endpoints
+        model_health = {}
+        for model_alias, health in zip(model_aliases, model_results):
+            if isinstance(health, BaseException):
+                health = {
                     "status": HealthStatus.ERROR,
-                    "message": f"{HealthMessages.HEALTH_CHECK_FAILED}: {str(e)}",
+                    "message": f"{HealthMessages.HEALTH_CHECK_FAILED}: {str(health)}",
                 }
+            model_health[model_alias] = health
 
         # Get current model assignments for each runner
         runner_models = {}
         runner_info = {}
-        for runner_name in self.runner_manager.get_runner_names():
-            current_model = await self.runner_manager.get_current_model_for_runner(
-                runner_name
-            )
+        now = time.time()
+        for runner_name in runner_names:
+            current_model = await get_current_model(runner_name)
             runner_models[runner_name] = current_model
 
             # Get runner info including host and port
-            runner = self.runner_manager.runners.get(runner_name)
+            runner = runners.get(runner_name)
             if runner:
                 # Calculate auto-unload countdown
                 auto_unload_countdown = None
@@ -471,7 +814,7 @@ class APIServer:
                     and runner.last_activity_ts is not None
                     and runner.active_requests == 0
                 ):
-                    elapsed = time.time() - runner.last_activity_ts
+                    elapsed = now - runner.last_activity_ts
                     remaining = runner.auto_unload_timeout_seconds - elapsed
                     auto_unload_countdown = max(0, int(remaining))
 
@@ -492,7 +835,7 @@ class APIServer:
             "model_health": model_health,
         }
 
-        return web.json_response(response)
+        return response
 
     async def handle_runner_start(self, request):
         """Handle POST /v1/runners/{runner_name}/start requests.
@@ -503,16 +846,12 @@ class APIServer:
         Returns:
             The response.
         """
-        runner_name = request.match_info.get("runner_name")
-        if not runner_name:
-            return web.json_response(
-                {"success": False, "error": {"message": "Runner name not provided"}},
-                status=400,
-            )
+        # The router only matches non-empty path segments
+        runner_name = request.match_info["runner_name"]
 
         # Check if runner exists
-        if runner_name not in self.runner_manager.get_runner_names():
-            return web.json_response(
+        if runner_name not in self.runner_manager.runner_names_set:
+            return _json_response(
                 {
                     "success": False,
                     "error": {"message": f"Unknown runner: {runner_name}"},
@@ -523,20 +862,21 @@ class APIServer:
         try:
             # Start the runner
             success = await self.runner_manager.start_runner(runner_name)
+            self._invalidate_health_cache()
 
             if success:
-                return web.json_response(
+                return _json_response(
                     {
                         "success": True,
                         "message": f"Runner {runner_name} started successfully",
                         "runner_name": runner_name,
                         "action": "start",
                         "status": "starting",
-                        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                        "timestamp": _iso_now(),
                     }
                 )
             else:
-                return web.json_response(
+                return _json_response(
                     {
                         "success": False,
                         "error": {
@@ -550,7 +890,7 @@ class APIServer:
 
         except Exception as e:
             logger.error(f"Error starting runner {runner_name}: {e}")
-            return web.json_response(
+            return _json_response(
                 {
                     "success": False,
                     "error": {
@@ -571,16 +911,12 @@ class APIServer:
         Returns:
             The response.
         """
-        runner_name = request.match_info.get("runner_name")
-        if not runner_name:
-            return web.json_response(
-                {"success": False, "error": {"message": "Runner name not provided"}},
-                status=400,
-            )
+        # The router only matches non-empty path segments
+        runner_name = request.match_info["runner_name"]
 
         # Check if runner exists
-        if runner_name not in self.runner_manager.get_runner_names():
-            return web.json_response(
+        if runner_name not in self.runner_manager.runner_names_set:
+            return _json_response(
                 {
                     "success": False,
                     "error": {"message": f"Unknown runner: {runner_name}"},
@@ -591,20 +927,21 @@ class APIServer:
         try:
             # Stop the runner
             success = await self.runner_manager.stop_runner(runner_name)
+            self._invalidate_health_cache()
 
             if success:
-                return web.json_response(
+                return _json_response(
                     {
                         "success": True,
                         "message": f"Runner {runner_name} stopped successfully",
                         "runner_name": runner_name,
                         "action": "stop",
                         "status": "stopping",
-                        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                        "timestamp": _iso_now(),
                     }
                 )
             else:
-                return web.json_response(
+                return _json_response(
                     {
                         "success": False,
                         "error": {
@@ -618,7 +955,7 @@ class APIServer:
 
         except Exception as e:
             logger.error(f"Error stopping runner {runner_name}: {e}")
-            return web.json_response(
+            return _json_response(
                 {
                     "success": False,
                     "error": {
@@ -639,16 +976,12 @@ class APIServer:
         Returns:
             The response.
         """
-        runner_name = request.match_info.get("runner_name")
-        if not runner_name:
-            return web.json_response(
-                {"success": False, "error": {"message": "Runner name not provided"}},
-                status=400,
-            )
+        # The router only matches non-empty path segments
+        runner_name = request.match_info["runner_name"]
 
         # Check if runner exists
-        if runner_name not in self.runner_manager.get_runner_names():
-            return web.json_response(
+        if runner_name not in self.runner_manager.runner_names_set:
+            return _json_response(
                 {
                     "success": False,
                     "error": {"message": f"Unknown runner: {runner_name}"},
@@ -672,20 +1005,21 @@ class APIServer:
 
             # Start again
             start_success = await self.runner_manager.start_runner(runner_name)
+            self._invalidate_health_cache()
 
             if start_success:
-                return web.json_response(
+                return _json_response(
                     {
                         "success": True,
                         "message": f"Runner {runner_name} restarted successfully",
                         "runner_name": runner_name,
                         "action": "restart",
                         "status": "restarting",
-                        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                        "timestamp": _iso_now(),
                     }
                 )
             else:
-                return web.json_response(
+                return _json_response(
                     {
                         "success": False,
                         "error": {
@@ -699,7 +1033,7 @@ class APIServer:
 
         except Exception as e:
             logger.error(f"Error restarting runner {runner_name}: {e}")
-            return web.json_response(
+            return _json_response(
                 {
                     "success": False,
                     "error": {
@@ -722,17 +1056,17 @@ class APIServer:
         """
         try:
             status = await self.runner_manager.get_runner_status()
-            return web.json_response(
+            return _json_response(
                 {
                     "success": True,
                     "runners": status,
-                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    "timestamp": _iso_now(),
                 }
             )
 
         except Exception as e:
             logger.error(f"Error getting runner status: {e}")
-            return web.json_response(
+            return _json_response(
                 {
                     "success": False,
                     "error": {"message": f"Failed to get runner status: {str(e)}"},
@@ -749,29 +1083,7 @@ class APIServer:
         Returns:
             The response.
         """
-        try:
-            data = await request.json()
-        except json.JSONDecodeError:
-            return web.json_response({"error": {"message": "Invalid JSON"}}, status=400)
-
-        model_alias = self._extract_model_alias(data)
-
-        if model_alias is None:
-            return web.json_response(
-                {"error": {"message": "Model not specified"}}, status=400
-            )
-
-        try:
-            self.config_manager.get_model_config(model_alias)
-        except ValueError:
-            return web.json_response(
-                {"error": {"message": f"Model not found: {model_alias}"}}, status=404
-            )
-
-        # Forward request with unified pre-flight approach
-        return await self._forward_request_unified(
-            request, model_alias, "/v1/chat/completions", data
-        )
+        return await self._parse_and_route(request, "/v1/chat/completions")
 
     async def handle_completions(self, request):
         """Handle POST /v1/completions requests.
@@ -782,29 +1094,7 @@ class APIServer:
         Returns:
             The response.
         """
-        try:
-            data = await request.json()
-        except json.JSONDecodeError:
-            return web.json_response({"error": {"message": "Invalid JSON"}}, status=400)
-
-        model_alias = self._extract_model_alias(data)
-
-        if model_alias is None:
-            return web.json_response(
-                {"error": {"message": "Model not specified"}}, status=400
-            )
-
-        try:
-            self.config_manager.get_model_config(model_alias)
-        except ValueError:
-            return web.json_response(
-                {"error": {"message": f"Model not found: {model_alias}"}}, status=404
-            )
-
-        # Forward request with unified pre-flight approach
-        return await self._forward_request_unified(
-            request, model_alias, "/v1/completions", data
-        )
+        return await self._parse_and_route(request, "/v1/completions")
 
     async def handle_embeddings(self, request):
         """Handle POST /v1/embeddings requests.
@@ -815,29 +1105,7 @@ class APIServer:
         Returns:
             The response.
         """
-        try:
-            data = await request.json()
-        except json.JSONDecodeError:
-            return web.json_response({"error": {"message": "Invalid JSON"}}, status=400)
-
-        model_alias = self._extract_model_alias(data)
-
-        if model_alias is None:
-            return web.json_response(
-                {"error": {"message": "Model not specified"}}, status=400
-            )
-
-        try:
-            self.config_manager.get_model_config(model_alias)
-        except ValueError:
-            return web.json_response(
-                {"error": {"message": f"Model not found: {model_alias}"}}, status=404
-            )
-
-        # Forward request with unified pre-flight approach
-        return await self._forward_request_unified(
-            request, model_alias, "/v1/embeddings", data
-        )
+        return await self._parse_and_route(request, "/v1/embeddings")
 
     async def handle_rerank(self, request):
         """Handle POST /v1/rerank requests.
@@ -848,29 +1116,7 @@ class APIServer:
         Returns:
             The response.
         """
-        try:
-            data = await request.json()
-        except json.JSONDecodeError:
-            return web.json_response({"error": {"message": "Invalid JSON"}}, status=400)
-
-        model_alias = self._extract_model_alias(data)
-
-        if model_alias is None:
-            return web.json_response(
-                {"error": {"message": "Model not specified"}}, status=400
-            )
-
-        try:
-            self.config_manager.get_model_config(model_alias)
-        except ValueError:
-            return web.json_response(
-                {"error": {"message": f"Model not found: {model_alias}"}}, status=404
-            )
-
-        # Forward request with unified pre-flight approach
-        return await self._forward_request_unified(
-            request, model_alias, "/v1/rerank", data
-        )
+        return await self._parse_and_route(request, "/v1/rerank")
 
     async def handle_responses(self, request):
         """Handle POST /v1/responses requests (OpenAI Responses API).
@@ -885,29 +1131,53 @@ class APIServer:
         Returns:
             The response.
         """
+        return await self._parse_and_route(request, "/v1/responses")
+
+    async def _parse_and_route(self, request, endpoint):
+        """Parse a model request, validate the requested model and forward it.
+
+        Shared by all OpenAI-compatible POST endpoints.
+
+        Args:
+            request: The request.
+            endpoint: The API endpoint to forward to.
+
+        Returns:
+            The response.
+        """
+        # Reject oversized payloads from the Content-Length header before the
+        # body is read; chunked bodies are checked once they have been read.
+        max_body_bytes = ENDPOINT_MAX_BODY_BYTES.get(endpoint, MAX_REQUEST_BODY_BYTES)
+        content_length = request.content_length
+        if content_length is not None and content_length > max_body_bytes:
+            return _json_body_response(_ERROR_PAYLOAD_TOO_LARGE, status=413)
+
+        try:
+            body = await request.read()
+        except web.HTTPRequestEntityTooLarge:
+            return _json_body_response(_ERROR_PAYLOAD_TOO_LARGE, status=413)
+        if len(body) > max_body_bytes:
+            return _json_body_response(_ERROR_PAYLOAD_TOO_LARGE, status=413)
+
         try:
-            data = await request.json()
+            data = json_loads(body)
         except json.JSONDecodeError:
-            return web.json_response({"error": {"message": "Invalid JSON"}}, status=400)
+            return _json_body_response(_ERROR_INVALID_JSON, status=400)
 
         model_alias = self._extract_model_alias(data)
 
         if model_alias is None:
-            return web.json_response(
-                {"error": {"message": "Model not specified"}}, status=400
-            )
+            return _json_body_response(_ERROR_MODEL_NOT_SPECIFIED, status=400)
 
         try:
             self.config_manager.get_model_config(model_alias)
         except ValueError:
-            return web.json_response(
+            return _json_response(
                 {"error": {"message": f"Model not found: {model_alias}"}}, status=404
             )
 
         # Forward request with unified pre-flight approach
-        return await self._forward_request_unified(
-            request, model_alias, "/v1/responses", data
-        )
+        return await self._forward_request_unified(request, model_alias, endpoint, data)
 
     def _extract_model_alias(self, data):
         """Extract the model alias from the request data.
@@ -930,6 +1200,31 @@ class APIServer:
         except IndexError:
             return None
 
+    async def _ensure_model_ready(self, model_alias):
+        """Run the pre-flight readiness check, sharing it between concurrent requests.
+
+        Requests for the same model that arrive while a check is in progress
+        wait for that check instead of starting their own.
+
+        Args:
+            model_alias: The model alias.
+
+        Returns:
+            Tuple of (is_ready: bool, error_message: str or None)
+        """
+        task = self._ready_inflight.get(model_alias)
+        if task is None:
+            task = asyncio.ensure_future(
+                self.runner_manager.ensure_model_ready_with_retry(model_alias)
+            )
+            self._ready_inflight[model_alias] = task
+            task.add_done_callback(
+                lambda _: self._ready_inflight.pop(model_alias, None)
+            )
+        # Shield the shared check so one disconnecting client does not cancel
+        # it for every other waiter
+        return await asyncio.shield(task)
+
     async def _forward_request_unified(self, request, model_alias, endpoint, data):
         """Unified request forwarding with pre-flight readiness check for both streaming and non-streaming.
 
@@ -942,16 +1237,20 @@ class APIServer:
         Returns:
             The response.
         """
-        # Step 1: Pre-flight readiness check with retry
-        logger.debug(f"Ensuring model {model_alias} is ready for request to {endpoint}")
-        (
-            is_ready,
-            error_message,
-        ) = await self.runner_manager.ensure_model_ready_with_retry(model_alias)
+        # Step 1: Pre-flight readiness check with retry, skipped when the model
+        # was confirmed ready moments ago
+        runner = self.runner_manager.get_runner_for_model(model_alias)
+        if runner is not None and runner.is_ready_cache_fresh(model_alias):
+            is_ready, error_message = True, None
+        else:
+            logger.debug(
+                "Ensuring model %s is ready for request to %s", model_alias, endpoint
+            )
+            is_ready, error_message = await self._ensure_model_ready(model_alias)
 
         if not is_ready:
             logger.error(f"Model {model_alias} not ready: {error_message}")
-            return web.json_response(
+            return _json_response(
                 {
                     "error": {
                         "message": f"Model not ready: {error_message}",
@@ -966,27 +1265,27 @@ class APIServer:
 
         if is_streaming:
             logger.debug(
-                f"Forwarding streaming request to model {model_alias} at {endpoint}"
+                "Forwarding streaming request to model %s at %s", model_alias, endpoint
             )
             return await self._forward_streaming_request(
                 request, model_alias, endpoint, data
             )
         else:
             logger.debug(
-                f"Forwarding non-streaming request to model {model_alias} at {endpoint}"
+                "Forwarding non-streaming request to model %s at %s",
+                model_alias,
+                endpoint,
             )
             request_start_notified = False
             try:
                 await self._notify_request_start(model_alias)
                 request_start_notified = True
-                (
-                    success,
-                    response_data,
-                    status_code,
-                ) = await self.runner_manager.forward_request(
+                # Relay the runner's JSON body as-is instead of decoding and
+                # re-encoding it
+                status_code, body = await self.runner_manager.forward_request_raw(
                     model_alias, endpoint, data
                 )
-                return web.json_response(response_data, status=status_code)
+                return _json_body_response(body, status=status_code)
             finally:
                 if request_start_notified:
                     await self._notify_request_end(model_alias)
@@ -1006,7 +1305,7 @@ class APIServer:
         # Get runner for model
         runner = self.runner_manager.get_runner_for_model(model_alias)
         if runner is None:
-            return web.json_response(
+            return _json_response(
                 {"error": {"message": f"Model not available: {model_alias}"}},
                 status=500,
             )
@@ -1021,7 +1320,7 @@ class APIServer:
                 error_message,
             ) = await self.runner_manager.ensure_model_ready_with_retry(model_alias)
             if not is_ready:
-                return web.json_response(
+                return _json_response(
                     {
                         "error": {
                             "message": f"Model not ready for streaming: {error_message}",
@@ -1031,8 +1330,8 @@ class APIServer:
                     status=503,
                 )
 
-        # Build URL using runner's host and port
-        url = f"http://{runner.host}:{runner.port}{endpoint}"
+        # Build URL from the runner's base URL
+        url = f"{runner.base_url}{endpoint}"
 
         # Forward streaming request
         request_start_notified = False
@@ -1058,92 +1357,142 @@ class APIServer:
                     sock_read=streaming_timeout,
                 )
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url, json=data, timeout=timeout_config
-                ) as response:
-                    # Check if this is an error response
-                    if response.status != 200:
-                        try:
-                            error_data = await response.json()
-                            return web.json_response(error_data, status=response.status)
-                        except (json.JSONDecodeError, aiohttp.ContentTypeError):
-                            error_text = await response.text()
-                            return web.json_response(
-                                {"error": {"message": error_text}},
-                                status=response.status,
-                            )
-
-                    # Create a streaming response with the same headers
-                    headers = {
-                        "Content-Type": response.headers.get(
-                            "Content-Type", "text/event-stream"
-                        ),
-                        "Cache-Control": "no-cache",
-                        "Connection": "keep-alive",
-                    }
-
-                    # Create streaming response
-                    streaming_response = web.StreamResponse(
-                        status=response.status, headers=headers
+            # Encode the body with the fast encoder rather than aiohttp's
+            # json= argument, which always goes through the stdlib encoder
+            async with self.upstream_session.post(
+                url,
+                data=json_dumps(data),
+                headers=UPSTREAM_JSON_HEADERS,
+                timeout=timeout_config,
+            ) as response:
+                # Check if this is an error response
+                if response.status != 200:
+                    # Read the body once, capped in case the runner dumps a
+                    # huge stack trace, and decode it from that single buffer
+                    body = await _read_capped(
+                        response.content, UPSTREAM_ERROR_BODY_MAX_BYTES
                     )
-                    await streaming_response.prepare(request)
+                    try:
+                        error_data = json_loads(body)
+                    except json.JSONDecodeError:
+                        error_data = {
+                            "error": {"message": body.decode("utf-8", errors="replace")}
+                        }
+                    return _json_response(error_data, status=response.status)
+
+                content_type = response.headers.get("Content-Type", "text/event-stream")
+
+                # A runner that ignores "stream" answers with a plain body.
+                # Relay its bytes unchanged: the SSE event alignment does not
+                # apply, and keepalive comments would corrupt the body. The
+                # upstream Content-Length is not copied because aiohttp
+                # decompresses the body, so it is sent chunked instead.
+                if not content_type.startswith("text/event-stream"):
+                    passthrough_response = web.StreamResponse(
+                        status=response.status,
+                        headers={"Content-Type": content_type},
+                    )
+                    await passthrough_response.prepare(request)
+                    async for chunk in response.content.iter_chunked(
+                        self.stream_chunk_bytes
+                    ):
+                        await passthrough_response.write(chunk)
+                    await passthrough_response.write_eof()
+                    return passthrough_response
+
+                # Create a streaming response with the same headers
+                headers = {
+                    "Content-Type": content_type,
+                    "Cache-Control": "no-cache",
+                    "Connection": "keep-alive",
+                }
 
-                    # Track last activity to avoid sending keepalive during active streaming
-                    last_activity = time.time()
-                    keepalive_stop = asyncio.Event()
+                # Create streaming response
+                streaming_response = web.StreamResponse(
+                    status=response.status, headers=headers
+                )
+                await streaming_response.prepare(request)
 
-                    # Start SSE keepalive pings to avoid client inactivity timeouts
-                    async def _keepalive():
-                        try:
-                            while not keepalive_stop.is_set():
-                                await asyncio.sleep(
-                                    keepalive_check_timeout
-                                )  # Check every keepalive_check_timeout seconds
-                                if keepalive_stop.is_set():
-                                    break
+                # Track last activity to avoid sending keepalive during active streaming
+                last_activity = time.time()
+                keepalive_stop = asyncio.Event()
 
-                                # Only send keepalive if no data sent in last keepalive_check_timeout seconds
-                                if (
-                                    time.time() - last_activity
-                                    > keepalive_check_timeout
-                                ):
-                                    try:
-                                        # SSE comment - standard keepalive that clients ignore
-                                        await streaming_response.write(b":\n\n")
-                                    except Exception:
-                                        break
-                        except asyncio.CancelledError:
-                            pass
-
-                    keepalive_task = asyncio.create_task(_keepalive())
-
-                    # Stream the response data
+                # Start SSE keepalive pings to avoid client inactivity timeouts
+                async def _keepalive():
                     try:
-                        async for chunk in response.content.iter_chunked(8192):
-                            await streaming_response.write(chunk)
-                            last_activity = time.time()
-                    finally:
-                        keepalive_stop.set()
-                        try:
-                            keepalive_task.cancel()
-                        except Exception:
-                            pass
+                        while not keepalive_stop.is_set():
+                            await asyncio.sleep(
+                                keepalive_check_timeout
+                            )  # Check every keepalive_check_timeout seconds
+                            if keepalive_stop.is_set():
+                                break
+
+                            # Only send keepalive if no data sent in last keepalive_check_timeout seconds
+                            if time.time() - last_activity > keepalive_check_timeout:
+                                try:
+                                    # SSE comment - standard keepalive that clients ignore
+                                    await streaming_response.write(b":\n\n")
+                                except Exception:
+                                    break
+                    except asyncio.CancelledError:
+                        pass
+
+                keepalive_task = asyncio.create_task(_keepalive())
+
+                # Stream the response data. Writes are aligned to SSE event
+                # boundaries: an event split across upstream reads is held back
+                # until it is complete (or STREAM_FLUSH_BYTES have piled up), so
+                # it goes out in one write and keepalive comments never land
+                # in the middle of an event.
+                pending = bytearray()
+                # Bind what the loop touches per chunk to locals
+                write = streaming_response.write
+                clock = time.time
+                terminators = SSE_EVENT_TERMINATORS
+                flush_bytes = STREAM_FLUSH_BYTES
+                try:
+                    async for chunk in response.content.iter_chunked(
+                        self.stream_chunk_bytes
+                    ):
+                        if pending:
+                            pending += chunk
+                            if (
+                                not pending.endswith(terminators)
+                                and len(pending) < flush_bytes
+                            ):
+                                continue
+                            chunk = bytes(pending)
+                            pending.clear()
+                        elif (
+                            not chunk.endswith(terminators) and len(chunk) < flush_bytes
+                        ):
+                            pending += chunk
+                            continue
+                        await write(chunk)
+                        last_activity = clock()
+                    if pending:
+                        await write(bytes(pending))
+                finally:
+                    keepalive_stop.set()
+                    try:
+                        keepalive_task.cancel()
+                    except Exception:
+                        pass
 
-                    await streaming_response.write_eof()
-                    return streaming_response
+                await streaming_response.write_eof()
+                return streaming_response
 
         except aiohttp.ClientError as e:
             logger.error(
                 f"Error forwarding streaming request to {url}: message='{str(e)}', url='{url}'"
             )
-            return web.json_response(
+            return _json_response(
                 {"error": {"message": f"Error forwarding streaming request: {str(e)}"}},
                 status=503,
             )
         except Exception as e:
             logger.error(f"Error forwarding streaming request to {url}: {e}")
-            return web.json_response(
+            return _json_response(
                 {"error": {"message": f"Error forwarding streaming request: {str(e)}"}},
                 status=500,
             )
@@ -1173,9 +1522,17 @@ async def main():
             print(f"API server running at {api_server.get_url()}")
             print("Press Ctrl+C to stop")
 
-            # Keep main thread alive
-            while True:
-                await asyncio.sleep(1)
+            # Wait until SIGINT/SIGTERM instead of waking up periodically
+            stop_event = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            try:
+                for sig in (signal.SIGINT, signal.SIGTERM):
+                    loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                # Windows has no asyncio signal handlers; Ctrl+C still raises
+                # KeyboardInterrupt out of the wait below
+                pass
+            await stop_event.wait()
         else:
             print("Failed to start API server")
             sys.exit(1)
@@ -1186,7 +1543,7 @@ async def main():
     finally:
         # Stop all runners
         if "runner_manager" in locals():
-            await runner_manager.stop_all_runners()
+            await runner_manager.shutdown()
 
         # Stop API server
         if "api_server" in locals():
@@ -5,13 +5,80 @@ This module handles loading, parsing, and validating configuration files for the
 It ensures that all required fields are present and that values are of the correct type.
 """
 
+import copy
 import json
 import os
 import logging
+from .json_utils import json_loads
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Top-level configuration keys that are not runner definitions
+_RESERVED_KEYS = frozenset(
+    {
+        "models",
+        "host",
+        "port",
+        "api",
+        "auto_start_runners",
+        "max_parallel_starts",
+        "retry_config",
+    }
+)
+
+# Optional model fields that only need a type check, mapped to
+# (accepted types, error message). rope-scale has always been validated as an
+# integer.
+_MODEL_FIELD_TYPES = {
+    "model_alias": (str, "Model alias must be a string"),
+    **{
+        field: (int, f"{field} must be an integer")
+        for field in (
+            "n_ctx",
+            "n_batch",
+            "u_batch",
+            "n_threads",
+            "main_gpu",
+            "n_gpu_layers",
+            "rope-scale",
+            "yarn-orig-ctx",
+        )
+    },
+    **{
+        field: (str, f"{field} must be a string")
+        for field in (
+            "mmproj",
+            "chat_template",
+            "split_mode",
+            "pooling",
+            "rope-scaling",
+            "cache-type-k",
+            "cache-type-v",
+            "args",
+        )
+    },
+    **{
+        field: (bool, f"{field} must be a boolean")
+        for field in ("offload_kqv", "use_mlock", "jinja", "embedding", "reranking")
+    },
+    "inherit_env": (bool, "inherit_env must be a boolean"),
+}
+
+# Runner fields that only need a type check, in the same form as
+# _MODEL_FIELD_TYPES
+_RUNNER_FIELD_TYPES = {
+    "type": (str, "Type must be a string"),
+    "path": (str, "Path must be a string"),
+    "host": (str, "Host must be a string"),
+    "port": (int, "Port must be an integer"),
+    "inherit_env": (bool, "inherit_env must be a boolean"),
+}
+
+# Validated configurations keyed by absolute path; each entry holds the file's
+# (st_mtime_ns, st_size) stamp and the configuration validated from it
+_CONFIG_CACHE = {}
+
 
 class ConfigManager:
     """Manager for FlexLLama configuration."""
@@ -23,8 +90,35 @@ class ConfigManager:
             config_path: Path to the configuration file.
         """
         self.config_path = config_path
-        self.config = self._load_config()
-        self._validate_config()
+
+        cache_path, stamp = self._get_config_stamp()
+        cached = _CONFIG_CACHE.get(cache_path)
+        if cached is not None and cached[0] == stamp:
+            logger.debug(f"Using cached configuration for {self.config_path}")
+            self.config = copy.deepcopy(cached[1])
+        else:
+            self.config = self._load_config()
+            self._validate_config()
+            _CONFIG_CACHE[cache_path] = (stamp, copy.deepcopy(self.config))
+
+        self._build_indexes()
+
+    def _get_config_stamp(self):
+        """Identify the current version of the configuration file.
+
+        Returns:
+            A tuple of (absolute path, (st_mtime_ns, st_size)).
+
+        Raises:
+            FileNotFoundError: If the configuration file does not exist.
+        """
+        try:
+            st = os.stat(self.config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Configuration file not found: {self.config_path}"
+            ) from None
+        return os.path.abspath(self.config_path), (st.st_mtime_ns, st.st_size)
 
     def _load_config(self):
         """Load the configuration from the file.
@@ -42,8 +136,8 @@ class ConfigManager:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
         try:
-            with open(self.config_path, "r") as f:
-                config = json.load(f)
+            with open(self.config_path, "rb") as f:
+                config = json_loads(f.read())
 
             return config
 
@@ -70,17 +164,11 @@ class ConfigManager:
             raise ValueError("Configuration must contain at least one model")
 
         # Collect all runner names
-        runner_names = set()
-        for key, value in self.config.items():
-            if key not in [
-                "models",
-                "host",
-                "port",
-                "api",
-                "auto_start_runners",
-                "retry_config",
-            ] and isinstance(value, dict):
-                runner_names.add(key)
+        runner_names = {
+            key
+            for key, value in self.config.items()
+            if key not in _RESERVED_KEYS and isinstance(value, dict)
+        }
 
         # Validate models and their runner references
         for i, model in enumerate(self.config["models"]):
@@ -97,8 +185,18 @@ class ConfigManager:
             if not isinstance(self.config["auto_start_runners"], bool):
                 raise ValueError("auto_start_runners must be a boolean")
 
+        # Validate max_parallel_starts if present
+        if "max_parallel_starts" in self.config:
+            max_parallel_starts = self.config["max_parallel_starts"]
+            if (
+                not isinstance(max_parallel_starts, int)
+                or isinstance(max_parallel_starts, bool)
+                or max_parallel_starts <= 0
+            ):
+                raise ValueError("max_parallel_starts must be a positive integer")
+
         # Validate runner configurations
-        used_ports = set()
+        used_ports = bytearray(65536 >> 3)
         for runner_name in runner_names:
             self._validate_runner_config(
                 self.config[runner_name], runner_name, used_ports
@@ -127,6 +225,12 @@ class ConfigManager:
                 api_config["health_endpoint"], str
             ):
                 raise ValueError("API health_endpoint must be a string")
+            if "stream_chunk_bytes" in api_config and (
+                not isinstance(api_config["stream_chunk_bytes"], int)
+                or isinstance(api_config["stream_chunk_bytes"], bool)
+                or api_config["stream_chunk_bytes"] <= 0
+            ):
+                raise ValueError("API stream_chunk_bytes must be a positive integer")
         else:
             raise ValueError("API configuration missing required field: api")
 
@@ -212,53 +316,11 @@ class ConfigManager:
                 f"Model {index}: Referenced runner '{model['runner']}' not found in configuration"
             )
 
-        # Validate optional fields
-        if "model_alias" in model and not isinstance(model["model_alias"], str):
-            raise ValueError(f"Model {index}: Model alias must be a string")
-
-        int_fields = [
-            "n_ctx",
-            "n_batch",
-            "u_batch",
-            "n_threads",
-            "main_gpu",
-            "n_gpu_layers",
-            "rope-scale",
-            "yarn-orig-ctx",
-        ]
-        for field in int_fields:
-            if field in model and not isinstance(model[field], int):
-                raise ValueError(f"Model {index}: {field} must be an integer")
-
-        str_fields = [
-            "mmproj",
-            "chat_template",
-            "split_mode",
-            "pooling",
-            "rope-scaling",
-            "cache-type-k",
-            "cache-type-v",
-            "args",
-        ]
-        for field in str_fields:
-            if field in model and not isinstance(model[field], str):
-                raise ValueError(f"Model {index}: {field} must be a string")
-
-        num_fields = ["rope-scale"]
-        for field in num_fields:
-            if field in model and not isinstance(model[field], (int, float)):
-                raise ValueError(f"Model {index}: {field} must be a number")
-
-        bool_fields = [
-            "offload_kqv",
-            "use_mlock",
-            "jinja",
-            "embedding",
-            "reranking",
-        ]
-        for field in bool_fields:
-            if field in model and not isinstance(model[field], bool):
-                raise ValueError(f"Model {index}: {field} must be a boolean")
+        # Validate optional fields with simple type requirements
+        for field, value in model.items():
+            expected = _MODEL_FIELD_TYPES.get(field)
+            if expected is not None and not isinstance(value, expected[0]):
+                raise ValueError(f"Model {index}: {expected[1]}")
 
         # Validate and normalize flash_attn (supports both boolean and string values)
         if "flash_attn" in model:
@@ -302,17 +364,14 @@ class ConfigManager:
                         f"Model {index}: env keys and values must be strings"
                     )
 
-        # Validate inherit_env field
-        if "inherit_env" in model and not isinstance(model["inherit_env"], bool):
-            raise ValueError(f"Model {index}: inherit_env must be a boolean")
-
-    def _validate_runner_config(self, runner, runner_name: str, used_ports: set):
+    def _validate_runner_config(self, runner, runner_name: str, used_ports: bytearray):
         """Validate the runner configuration.
 
         Args:
             runner: The runner configuration to validate.
             runner_name: The name of the runner.
-            used_ports: Set of already used ports for conflict detection.
+            used_ports: Bitmap of already used ports (one bit per port) for
+                conflict detection.
 
         Raises:
             ValueError: If the runner configuration is invalid.
@@ -321,30 +380,29 @@ class ConfigManager:
         if "type" not in runner:
             raise ValueError(f"Runner {runner_name}: Missing required field: type")
 
-        if not isinstance(runner["type"], str):
-            raise ValueError(f"Runner {runner_name}: Type must be a string")
+        # Validate fields with simple type requirements
+        for field, value in runner.items():
+            expected = _RUNNER_FIELD_TYPES.get(field)
+            if expected is not None and not isinstance(value, expected[0]):
+                raise ValueError(f"Runner {runner_name}: {expected[1]}")
 
-        # Check path
+        # Default path to type if not specified
         if "path" not in runner:
-            # Default to type if path not specified
             runner["path"] = runner["type"]
-        elif not isinstance(runner["path"], str):
-            raise ValueError(f"Runner {runner_name}: Path must be a string")
-
-        # Check host (optional, will default if not provided)
-        if "host" in runner and not isinstance(runner["host"], str):
-            raise ValueError(f"Runner {runner_name}: Host must be a string")
 
         # Check port (optional, will auto-assign if not provided)
         if "port" in runner:
-            if not isinstance(runner["port"], int):
-                raise ValueError(f"Runner {runner_name}: Port must be an integer")
+            port = runner["port"]
+            if not 0 < port < 65536:
+                raise ValueError(
+                    f"Runner {runner_name}: Port must be between 1 and 65535"
+                )
 
             # Check for port conflicts
-            port = runner["port"]
-            if port in used_ports:
+            byte, bit = port >> 3, 1 << (port & 7)
+            if used_ports[byte] & bit:
                 raise ValueError(f"Runner {runner_name}: Port {port} already in use")
-            used_ports.add(port)
+            used_ports[byte] |= bit
 
         # Check extra_args
         if "extra_args" not in runner:
@@ -370,10 +428,6 @@ class ConfigManager:
                         f"Runner {runner_name}: env keys and values must be strings"
                     )
 
-        # Check inherit_env
-        if "inherit_env" in runner and not isinstance(runner["inherit_env"], bool):
-            raise ValueError(f"Runner {runner_name}: inherit_env must be a boolean")
-
         # Check auto_unload_timeout_seconds
         if "auto_unload_timeout_seconds" not in runner:
             runner["auto_unload_timeout_seconds"] = 0
@@ -386,6 +440,48 @@ class ConfigManager:
                 f"Runner {runner_name}: auto_unload_timeout_seconds must be non-negative"
             )
 
+    def _build_indexes(self):
+        """Precompute the lookup tables served by the getters.
+
+        Must be called whenever self.config is replaced.
+        """
+        self._runner_names = [
+            key
+            for key, value in self.config.items()
+            if key not in _RESERVED_KEYS and isinstance(value, dict)
+        ]
+
+        # Resolve each runner's address once; the host falls back to the API host
+        api_host = self.config["api"]["host"]
+        self._runner_hosts = {
+            name: self.config[name].get("host", api_host) for name in self._runner_names
+        }
+        self._runner_ports = {
+            name: self.config[name]["port"]
+            for name in self._runner_names
+            if "port" in self.config[name]
+        }
+
+        self._models_by_alias = {}
+        self._model_aliases = []
+        self._model_runner_map = {}
+        for model in self.config["models"]:
+            # get_model_config only matches explicit aliases; keep the first
+            # model for each alias, as the previous linear scan did
+            if "model_alias" in model:
+                self._models_by_alias.setdefault(model["model_alias"], model)
+            alias = model.get("model_alias", os.path.basename(model["model"]))
+            self._model_aliases.append(alias)
+            self._model_runner_map[alias] = model["runner"]
+
+        # Retry settings are read on every readiness check; validation has
+        # already filled in their defaults
+        retry_config = self.get_retry_config()
+        self._max_retries = retry_config.get("max_retries", 5)
+        self._base_delay_seconds = retry_config.get("base_delay_seconds", 2)
+        self._max_delay_seconds = retry_config.get("max_delay_seconds", 30)
+        self._retry_on_model_loading = retry_config.get("retry_on_model_loading", True)
+
     def get_config(self):
         """Get the full configuration.
 
@@ -409,11 +505,10 @@ class ConfigManager:
         if model_alias is None:
             return self.config["models"][0]
 
-        for model in self.config["models"]:
-            if model.get("model_alias") == model_alias:
-                return model
-
-        raise ValueError(f"Model alias not found: {model_alias}")
+        model = self._models_by_alias.get(model_alias)
+        if model is None:
+            raise ValueError(f"Model alias not found: {model_alias}")
+        return model
 
     def get_runner_config(self, runner_name: str):
         """Get a runner configuration by name.
@@ -475,10 +570,7 @@ class ConfigManager:
         Returns:
             A list of all model aliases.
         """
-        return [
-            model.get("model_alias", os.path.basename(model["model"]))
-            for model in self.config["models"]
-        ]
+        return list(self._model_aliases)
 
     def get_runner_names(self):
         """Get all runner names.
@@ -486,20 +578,7 @@ class ConfigManager:
         Returns:
             A list of all runner names.
         """
-        return [
-            key
-            for key in self.config.keys()
-            if key
-            not in [
-                "models",
-                "host",
-                "port",
-                "api",
-                "auto_start_runners",
-                "retry_config",
-            ]
-            and isinstance(self.config[key], dict)
-        ]
+        return list(self._runner_names)
 
     def get_model_runner_map(self):
         """Get a mapping of model aliases to runner names.
@@ -507,11 +586,7 @@ class ConfigManager:
         Returns:
             A dictionary mapping model aliases to runner names.
         """
-        model_runner_map = {}
-        for model in self.config["models"]:
-            alias = model.get("model_alias", os.path.basename(model["model"]))
-            model_runner_map[alias] = model["runner"]
-        return model_runner_map
+        return dict(self._model_runner_map)
 
     def get_auto_start_runners(self):
         """Get the auto-start runners setting.
@@ -521,6 +596,14 @@ class ConfigManager:
         """
         return self.config.get("auto_start_runners", True)
 
+    def get_max_parallel_starts(self):
+        """Get the maximum number of runners auto-started at the same time.
+
+        Returns:
+            The configured limit, or None if runners may all start at once.
+        """
+        return self.config.get("max_parallel_starts")
+
     def get_api_host(self):
         """Get the API server host.
 
@@ -551,6 +634,14 @@ class ConfigManager:
         """
         return self.config.get("api", {}).get("health_endpoint", "/health")
 
+    def get_stream_chunk_bytes(self):
+        """Get the maximum chunk size used when relaying streaming responses.
+
+        Returns:
+            The chunk size in bytes. Defaults to 65536 (64 KiB).
+        """
+        return self.config.get("api", {}).get("stream_chunk_bytes", 65536)
+
     def get_cors_allow_origins(self):
         """Get the list of CORS allowed origins for the API server.
 
@@ -583,11 +674,10 @@ class ConfigManager:
         Raises:
             ValueError: If the runner name is not found.
         """
-        if runner_name not in self.config:
-            raise ValueError(f"Runner not found: {runner_name}")
-
-        runner_config = self.config[runner_name]
-        return runner_config.get("host", self.get_api_host())
+        try:
+            return self._runner_hosts[runner_name]
+        except KeyError:
+            raise ValueError(f"Runner not found: {runner_name}") from None
 
     def get_runner_port(self, runner_name: str):
         """Get the port for a specific runner.
@@ -601,14 +691,12 @@ class ConfigManager:
         Raises:
             ValueError: If the runner name is not found or the port is not configured.
         """
-        if runner_name not in self.config:
+        port = self._runner_ports.get(runner_name)
+        if port is not None:
+            return port
+        if runner_name not in self._runner_hosts:
             raise ValueError(f"Runner not found: {runner_name}")
-
-        runner_config = self.config[runner_name]
-        if "port" in runner_config:
-            return runner_config["port"]
-        else:
-            raise ValueError(f"Runner {runner_name}: Port not configured")
+        raise ValueError(f"Runner {runner_name}: Port not configured")
 
     def get_retry_config(self):
         """Get the retry configuration.
@@ -632,7 +720,7 @@ class ConfigManager:
         Returns:
             The maximum number of retries.
         """
-        return self.get_retry_config().get("max_retries", 5)
+        return self._max_retries
 
     def get_base_delay_seconds(self):
         """Get the base delay in seconds between retries.
@@ -640,7 +728,7 @@ class ConfigManager:
         Returns:
             The base delay in seconds.
         """
-        return self.get_retry_config().get("base_delay_seconds", 2)
+        return self._base_delay_seconds
 
     def get_max_delay_seconds(self):
         """Get the maximum delay in seconds between retries.
@@ -648,7 +736,7 @@ class ConfigManager:
         Returns:
             The maximum delay in seconds.
         """
-        return self.get_retry_config().get("max_delay_seconds", 30)
+        return self._max_delay_seconds
 
     def get_retry_on_model_loading(self):
         """Get whether to retry on model loading errors.
@@ -656,7 +744,7 @@ class ConfigManager:
         Returns:
             True if retries should be performed on model loading errors, False otherwise.
         """
-        return self.get_retry_config().get("retry_on_model_loading", True)
+        return self._retry_on_model_loading
 
     def get_request_timeout_seconds(self):
         """Get the request timeout in seconds for forwarding requests to runners.
@@ -0,0 +1,52 @@
+"""
+JSON helpers for FlexLLama.
+
+This module provides a single place for JSON encoding and decoding. It uses
+orjson when it is installed (``pip install flexllama[speedups]``) and falls
+back to the standard library json module otherwise, so the faster codec is
+never a hard requirement.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """Decode a JSON document.
+
+    Args:
+        data: The JSON document as bytes or str.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON. orjson's
+            JSONDecodeError subclasses it, so callers only need to catch the
+            standard library exception.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON.
+
+    Args:
+        obj: The object to encode.
+        indent: Whether to pretty-print the document with a two-space indent
+            instead of encoding it compactly.
+
+    Returns:
+        The encoded JSON document as bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -12,15 +12,134 @@ import time
 import logging
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
-import socket
+from types import MappingProxyType
 import aiohttp
 import json
 import psutil
+import select
 import shlex
+from .json_utils import json_dumps, json_loads
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, which also has no pidfds
+    resource = None
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# How long a successful readiness check lets requests skip the pre-flight probe
+READY_CACHE_TTL_SECONDS = 5.0
+
+# How long a newly started runner gets to start accepting connections
+RUNNER_STARTUP_TIMEOUT_SECONDS = 32.0
+
+# Delay before the second startup readiness probe; doubles after each attempt
+READINESS_BACKOFF_INITIAL_SECONDS = 0.05
+
+# Upper bound on the delay between startup readiness probes
+READINESS_BACKOFF_MAX_SECONDS = 1.0
+
+# Connect timeout for a single startup readiness probe
+SERVER_READY_CONNECT_TIMEOUT_SECONDS = 1.0
+
+# How long a stopping runner gets to exit before it is killed
+PROCESS_STOP_TIMEOUT_SECONDS = 3.0
+
+# Delay before the second model health poll; grows by half after each poll
+MODEL_READY_POLL_INITIAL_SECONDS = 0.1
+
+# Upper bound on the delay between model health polls
+MODEL_READY_POLL_MAX_SECONDS = 2.0
+
+# Headers for JSON bodies forwarded to the runners
+UPSTREAM_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _wait_procs(procs, timeout):
+    """Wait for processes to exit.
+
+    On Linux each process is watched through a pidfd and a single poll() call
+    returns as soon as they exit, including processes that linger as zombies.
+    Elsewhere, or when pidfds cannot be opened, psutil.wait_procs() is used.
+
+    Args:
+        procs: The psutil.Process objects to wait for.
+        timeout: Maximum number of seconds to wait.
+
+    Returns:
+        The processes that are still alive.
+    """
+    if not procs:
+        return []
+    if not hasattr(os, "pidfd_open") or resource is None:
+        return psutil.wait_procs(procs, timeout=timeout)[1]
+
+    # Leave plenty of descriptors for the rest of the server
+    if len(procs) > resource.getrlimit(resource.RLIMIT_NOFILE)[0] // 2:
+        return psutil.wait_procs(procs, timeout=timeout)[1]
+
+    pidfds = {}
+    try:
+        for proc in procs:
+            try:
+                pidfds[os.pidfd_open(proc.pid)] = proc
+            except ProcessLookupError:
+                # Already exited and reaped
+                continue
+            except OSError:
+                return psutil.wait_procs(procs, timeout=timeout)[1]
+
+        poller = select.poll()
+        for fd in pidfds:
+            poller.register(fd, select.POLLIN)
+
+        pending = set(pidfds)
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for fd, _ in poller.poll(remaining * 1000):
+                poller.unregister(fd)
+                pending.discard(fd)
+        return [pidfds[fd] for fd in pending]
+    finally:
+        for fd in pidfds:
+            os.close(fd)
+
+
+# Model options passed to the runner, in command-line order. Each entry is
+# (config key, flag, kind): "value" passes the value after the flag, "list"
+# passes the values joined with commas, "flag" adds the flag when the value is
+# true and "no_flag" adds it when the value is false.
+_MODEL_CLI_FLAGS = (
+    ("mmproj", "--mmproj", "value"),
+    ("model_alias", "--alias", "value"),
+    ("n_ctx", "--ctx-size", "value"),
+    ("n_batch", "--batch-size", "value"),
+    ("u_batch", "--ubatch-size", "value"),
+    ("n_threads", "--threads", "value"),
+    ("chat_template", "--chat-template", "value"),
+    ("split_mode", "--split-mode", "value"),
+    ("embedding", "--embedding", "flag"),
+    ("reranking", "--reranking", "flag"),
+    ("offload_kqv", "--no-kv-offload", "no_flag"),
+    ("jinja", "--jinja", "flag"),
+    ("pooling", "--pooling", "value"),
+    ("flash_attn", "--flash-attn", "value"),
+    ("use_mlock", "--mlock", "flag"),
+    ("main_gpu", "--main-gpu", "value"),
+    ("tensor_split", "--tensor-split", "list"),
+    ("n_gpu_layers", "--n-gpu-layers", "value"),
+    ("cache-type-k", "--cache-type-k", "value"),
+    ("cache-type-v", "--cache-type-v", "value"),
+    ("rope-scaling", "--rope-scaling", "value"),
+    ("rope-scale", "--rope-scale", "value"),
+    ("yarn-orig-ctx", "--yarn-orig-ctx", "value"),
+)
+
 
 # Health Status Constants
 class HealthStatus:
@@ -47,10 +166,95 @@ class HealthMessages:
     HEALTH_CHECK_FAILED = "Health check failed"
 
 
+def _resolve_model_alias(model_config):
+    """Get the alias a model is served under.
+
+    Args:
+        model_config: The model configuration.
+
+    Returns:
+        The configured model_alias, or the model file's base name if unset.
+    """
+    if "model_alias" in model_config:
+        return model_config["model_alias"]
+    return os.path.basename(model_config["model"])
+
+
+def _error_body(message):
+    """Encode an error response body.
+
+    Args:
+        message: The error message.
+
+    Returns:
+        The JSON-encoded error document as bytes.
+    """
+    return json_dumps({"error": {"message": message}})
+
+
+# Pre-encoded body for the forwarding error whose message never changes
+_ERROR_REQUEST_TIMEOUT = _error_body("Request timeout")
+
+
+def _run_taskkill(pids):
+    """Forcefully kill Windows process trees with a single taskkill call.
+
+    Args:
+        pids: PIDs of the processes whose trees should be killed.
+
+    Returns:
+        False if taskkill is not available, True otherwise.
+    """
+    args = ["taskkill", "/F", "/T"]
+    for pid in pids:
+        args.extend(("/PID", str(pid)))
+    try:
+        result = subprocess.run(args, capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        return False
+    if result.returncode != 0 and result.returncode != 128:
+        logger.warning(
+            f"taskkill for PIDs {', '.join(map(str, pids))} returned exit code "
+            f"{result.returncode}."
+            f"\n  stdout: {result.stdout.strip()}"
+            f"\n  stderr: {result.stderr.strip()}"
+        )
+    return True
+
+
+def _get_process(pid, create_time):
+    """Look up a process, making sure its PID has not been reused.
+
+    Args:
+        pid: PID of the process.
+        create_time: Creation time recorded when the process was spawned, or
+            None to skip the check.
+
+    Returns:
+        The psutil.Process, or None if the process has exited or the PID now
+        belongs to a different process.
+    """
+    try:
+        proc = psutil.Process(pid)
+        if create_time is not None and proc.create_time() != create_time:
+            return None
+    except psutil.NoSuchProcess:
+        return None
+    return proc
+
+
 class RunnerProcess:
     """Class representing a single FlexLLama process."""
 
-    def __init__(self, runner_name, runner_config, host, port, session_log_dir=None):
+    def __init__(
+        self,
+        runner_name,
+        runner_config,
+        host,
+        port,
+        session_log_dir=None,
+        kill_executor=None,
+    ):
         """Initialize a runner process.
 
         Args:
@@ -59,17 +263,30 @@ class RunnerProcess:
             host: Host to bind to.
             port: Port to bind to.
             session_log_dir: Session-specific log directory (optional).
+            kill_executor: Executor for the blocking process-tree kill
+                (optional, defaults to the event loop's default executor).
         """
         self.runner_name = runner_name
         self.runner_config = runner_config
         self.host = host
         self.port = port
+        # Runner URLs, built once since host and port never change
+        self.base_url = f"http://{host}:{port}"
+        self.health_url = f"{self.base_url}/health"
         self.session_log_dir = session_log_dir or "logs"
+        self._kill_executor = kill_executor
         self.process = None
+        # psutil creation time of self.process, to detect PID reuse
+        self.process_create_time = None
         self.output_file = None
         self.models = []  # List of models this runner is responsible for
         self.current_model = None  # Track which model is currently loaded
-        self.is_starting = False
+        self.current_model_alias = None  # Alias of current_model
+        self._models_by_alias = {}
+        self.model_aliases = []  # Aliases of self.models, in the same order
+        self._alias_by_model_id = {}  # Alias of each model, by id() of its config
+        # Set once an in-progress start finishes; None when not starting
+        self._starting_event = None
         self.start_time = None
 
         # Auto-unload state tracking
@@ -78,72 +295,85 @@ class RunnerProcess:
         )
         self.active_requests = 0
         self.last_activity_ts = None
+
+        # Monotonic time of the last successful readiness check
+        self.last_ready_ts = None
+
+        # Built (command, env_from_path) per model, keyed by id() of the model
+        # configuration; entries keep the configuration so a recycled id
+        # never matches
+        self._command_cache = {}
+
+        # Parsed runner path, shared by every model of this runner
+        self._parsed_path = None
         self._request_lock = asyncio.Lock()
 
-    def _kill_process_tree(self, pid: int):
-        """Terminate a process and all of its children, using an OS-specific method."""
+    @property
+    def is_starting(self):
+        """Whether the runner is currently starting a model."""
+        return self._starting_event is not None
+
+    def _kill_process_tree(self, pid: int, create_time=None):
+        """Terminate a process and all of its children, using an OS-specific method.
+
+        Nothing is signalled if the PID no longer belongs to the process
+        created at create_time.
+        """
         if os.name == "nt":
-            try:
-                # On Windows, taskkill is more reliable for killing process trees.
-                result = subprocess.run(
-                    ["taskkill", "/F", "/T", "/PID", str(pid)],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode != 0 and result.returncode != 128:
-                    logger.warning(
-                        f"taskkill for PID {pid} returned exit code {result.returncode}."
-                        f"\n  stdout: {result.stdout.strip()}"
-                        f"\n  stderr: {result.stderr.strip()}"
-                    )
-            except FileNotFoundError:
-                logger.warning("`taskkill` command not found. Falling back to psutil.")
-                self._kill_with_psutil(pid)
-        else:
-            self._kill_with_psutil(pid)
+            if _get_process(pid, create_time) is None:
+                return
+            # On Windows, taskkill is more reliable for killing process trees.
+            if _run_taskkill([pid]):
+                return
+            logger.warning("`taskkill` command not found. Falling back to psutil.")
+        self._kill_with_psutil(pid, create_time)
 
-    def _kill_with_psutil(self, pid: int):
-        """Terminate a process and all of its children using psutil."""
+    def _kill_with_psutil(self, pid: int, create_time=None):
+        """Terminate a process and all of its children using psutil.
+
+        The whole tree is signalled at once so it shuts down in parallel.
+        Children are then waited for and killed if they do not exit; the
+        process itself is an asyncio subprocess, so the event loop reaps it
+        and stop() waits for it there. Nothing is signalled if the PID no
+        longer belongs to the process created at create_time.
+        """
+        parent = _get_process(pid, create_time)
+        if parent is None:
+            return
         try:
-            parent = psutil.Process(pid)
+            children = parent.children(recursive=True)
         except psutil.NoSuchProcess:
             return
 
-        children = parent.children(recursive=True)
-        for child in children:
+        for proc in [parent, *children]:
             try:
-                child.terminate()
+                proc.terminate()
             except psutil.NoSuchProcess:
-                continue
+                pass
 
-        _, alive = psutil.wait_procs(children, timeout=3)
+        alive = _wait_procs(children, PROCESS_STOP_TIMEOUT_SECONDS)
         for child in alive:
             try:
                 child.kill()
             except psutil.NoSuchProcess:
                 pass
 
-        try:
-            parent.terminate()
-        except psutil.NoSuchProcess:
-            return
-
-        try:
-            parent.wait(timeout=3)
-        except psutil.TimeoutExpired:
-            try:
-                parent.kill()
-            except psutil.NoSuchProcess:
-                pass
-
     def add_model(self, model_config):
         """Add a model to this runner.
 
         Args:
             model_config: Configuration for the model.
+
+        Returns:
+            The alias the model is served under.
         """
         self.models.append(model_config)
+        alias = _resolve_model_alias(model_config)
+        self.model_aliases.append(alias)
+        self._alias_by_model_id[id(model_config)] = alias
+        # Keep the first model for each alias, as a linear scan would find it
+        self._models_by_alias.setdefault(alias, model_config)
+        return alias
 
     def get_model_by_alias(self, model_alias):
         """Get a model configuration by alias.
@@ -154,13 +384,7 @@ class RunnerProcess:
         Returns:
             The model configuration, or None if not found.
         """
-        for model in self.models:
-            if (
-                model.get("model_alias", os.path.basename(model["model"]))
-                == model_alias
-            ):
-                return model
-        return None
+        return self._models_by_alias.get(model_alias)
 
     def is_model_loaded(self, model_alias):
         """Check if a specific model is currently loaded.
@@ -174,10 +398,25 @@ class RunnerProcess:
         if self.current_model is None:
             return False
 
-        current_alias = self.current_model.get(
-            "model_alias", os.path.basename(self.current_model["model"])
+        return self.current_model_alias == model_alias
+
+    def is_ready_cache_fresh(self, model_alias):
+        """Check whether the model recently passed a readiness check.
+
+        Args:
+            model_alias: The alias of the model to check.
+
+        Returns:
+            True if the model is loaded in a live process and was confirmed
+            ready within READY_CACHE_TTL_SECONDS, False otherwise.
+        """
+        return (
+            self.last_ready_ts is not None
+            and time.monotonic() - self.last_ready_ts < READY_CACHE_TTL_SECONDS
+            and self.process is not None
+            and self.process.returncode is None
+            and self.is_model_loaded(model_alias)
         )
-        return current_alias == model_alias
 
     async def start_with_model(self, model_alias):
         """Start the runner with a specific model, handling model switching.
@@ -206,13 +445,7 @@ class RunnerProcess:
 
         # If a different model is loaded, stop the runner first
         if await self.is_running() and not self.is_model_loaded(model_alias):
-            current_alias = (
-                self.current_model.get(
-                    "model_alias", os.path.basename(self.current_model["model"])
-                )
-                if self.current_model
-                else "unknown"
-            )
+            current_alias = self.current_model_alias or "unknown"
             logger.info(
                 f"Switching runner {self.runner_name} from model {current_alias} to {model_alias}"
             )
@@ -243,17 +476,16 @@ class RunnerProcess:
         Returns:
             True if the process was started successfully, False otherwise.
         """
-        if self.process is not None and self.process.poll() is None:
+        if self.process is not None and self.process.returncode is None:
             logger.info(f"Runner {self.runner_name} is already running")
             return True
 
-        if self.is_starting:
+        if self._starting_event is not None:
             logger.info(f"Runner {self.runner_name} is already starting")
-            while self.is_starting:
-                await asyncio.sleep(0.5)
-            return self.process is not None and self.process.poll() is None
+            await self._starting_event.wait()
+            return self.process is not None and self.process.returncode is None
 
-        self.is_starting = True
+        self._starting_event = asyncio.Event()
         self.start_time = time.time()
 
         try:
@@ -279,24 +511,24 @@ class RunnerProcess:
                     f"Runner {self.runner_name}: applying env vars {', '.join(sorted(set(all_env_vars)))}"
                 )
 
-            # Use session log directory
-            log_dir = self.session_log_dir
-            os.makedirs(log_dir, exist_ok=True)
-
             # Create log file in session directory
-            log_file = os.path.join(log_dir, f"{self.runner_name}.log")
+            log_file = os.path.join(self.session_log_dir, f"{self.runner_name}.log")
 
-            model_alias = model_config.get(
-                "model_alias", os.path.basename(model_config["model"])
-            )
+            model_alias = self._alias_by_model_id.get(id(model_config))
+            if model_alias is None:
+                model_alias = _resolve_model_alias(model_config)
             logger.info(f"Starting runner {self.runner_name} with model {model_alias}")
             logger.info(f"Command: {' '.join(cmd)}")
             logger.info(f"Log file: {log_file}")
 
-            # Open log file
-            self.output_file = open(
-                log_file, "a"
-            )  # Use append mode to preserve logs across restarts
+            # Open log file, using append mode to preserve logs across restarts.
+            # The session directory is created up front by the manager; it is
+            # only created here if it has gone missing since.
+            try:
+                self.output_file = open(log_file, "a")
+            except FileNotFoundError:
+                os.makedirs(self.session_log_dir, exist_ok=True)
+                self.output_file = open(log_file, "a")
 
             # Add a separator in the log file for model switches
             self.output_file.write(
@@ -304,13 +536,12 @@ class RunnerProcess:
             )
             self.output_file.flush()
 
-            # Start process
+            # Start process. asyncio's subprocess support spawns it without
+            # blocking the loop and reaps it, so its exit can be awaited.
             try:
                 popen_kwargs = {
                     "stdout": self.output_file,
                     "stderr": self.output_file,
-                    "text": True,
-                    "bufsize": 1,
                     "env": env_for_child,
                 }
                 if os.name == "posix":
@@ -318,77 +549,81 @@ class RunnerProcess:
                 elif os.name == "nt":
                     popen_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
 
-                self.process = subprocess.Popen(cmd, **popen_kwargs)
+                self.process = await asyncio.create_subprocess_exec(
+                    *cmd, **popen_kwargs
+                )
+                # Recorded so a later kill cannot hit a process that reused
+                # the PID after the runner exited and was reaped
+                try:
+                    self.process_create_time = psutil.Process(
+                        self.process.pid
+                    ).create_time()
+                except psutil.NoSuchProcess:
+                    self.process_create_time = None
             except Exception as e:
                 logger.error(
                     f"Failed to create subprocess for runner {self.runner_name}: {e}"
                 )
-                self.process = None
-                self.output_file.close()
-                self.output_file = None
-                self.current_model = None
-                self.is_starting = False
+                self._release_process()
                 return False
 
-            # Wait for server to start
-            await asyncio.sleep(2)  # Initial wait
+            # Wait until the server accepts connections, racing the probes
+            # against process exit so a runner that dies during startup is
+            # noticed immediately instead of at the next probe
+            process = self.process
+            exit_task = asyncio.ensure_future(process.wait())
+            ready_task = asyncio.ensure_future(
+                self._wait_for_server_ready(RUNNER_STARTUP_TIMEOUT_SECONDS)
+            )
+            try:
+                await asyncio.wait(
+                    {exit_task, ready_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                exit_task.cancel()
+                ready_task.cancel()
 
-            # Check if process is still running
-            if self.process is not None and self.process.poll() is not None:
+            if process.returncode is not None:
                 logger.error(
-                    f"Runner {self.runner_name} exited with code: {self.process.returncode}"
+                    f"Runner {self.runner_name} exited with code: {process.returncode}"
                 )
-                self.process = None
-                self.output_file.close()
-                self.output_file = None
-                self.current_model = None
-                self.is_starting = False
+                self._release_process()
                 return False
 
-            # Wait for server to be ready
-            max_retries = 30
-            retry_interval = 1
-            for _ in range(max_retries):
-                if await self._is_server_ready():
-                    logger.info(
-                        f"Runner {self.runner_name} started successfully with model {model_alias}"
-                    )
-                    self.current_model = model_config
-                    self.last_activity_ts = time.time()
-                    self.active_requests = 0
-                    self.is_starting = False
-                    return True
-
-                # Check if process is still running
-                if self.process is not None and self.process.poll() is not None:
-                    logger.error(
-                        f"Runner {self.runner_name} exited with code: {self.process.returncode}"
-                    )
-                    self.process = None
-                    self.output_file.close()
-                    self.output_file = None
-                    self.current_model = None
-                    self.is_starting = False
-                    return False
-
-                await asyncio.sleep(retry_interval)
+            if ready_task.done() and not ready_task.cancelled() and ready_task.result():
+                logger.info(
+                    f"Runner {self.runner_name} started successfully with model {model_alias}"
+                )
+                self.current_model = model_config
+                self.current_model_alias = model_alias
+                self.last_activity_ts = time.time()
+                self.last_ready_ts = None
+                self.active_requests = 0
+                return True
 
             # Server did not start in time
             logger.error(f"Runner {self.runner_name} did not start in time")
             await self.stop()
-            self.is_starting = False
             return False
 
         except Exception as e:
             logger.error(f"Failed to start runner {self.runner_name}: {e}")
             if self.process is not None:
                 await self.stop()
-            self.is_starting = False
             return False
 
-    async def stop(self):
+        finally:
+            # Wake any callers that were waiting for this start to finish
+            self._starting_event.set()
+            self._starting_event = None
+
+    async def stop(self, kill_tree=True):
         """Stop the runner process.
 
+        Args:
+            kill_tree: Whether to signal the process tree. Pass False when the
+                tree has already been killed and only its exit needs awaiting.
+
         Returns:
             True if the process was stopped successfully, False otherwise.
         """
@@ -396,71 +631,103 @@ class RunnerProcess:
             logger.info(f"Runner {self.runner_name} is not running")
             return True
 
-        try:
-            current_alias = (
-                self.current_model.get(
-                    "model_alias", os.path.basename(self.current_model["model"])
-                )
-                if self.current_model
-                else "unknown"
-            )
+        process = self.process
+        create_time = self.process_create_time
+        current_alias = self.current_model_alias or "unknown"
+
+        if process.returncode is not None:
+            # Already exited and reaped by the event loop, so its PID may
+            # belong to another process by now; only release its state
             logger.info(
-                f"Stopping runner {self.runner_name} (current model: {current_alias})"
+                f"Runner {self.runner_name} already exited with code: "
+                f"{process.returncode}"
             )
+            if self.process is process:
+                self._release_process()
+            self.last_ready_ts = None
+            self.last_activity_ts = None
+            self.active_requests = 0
+            return True
 
-            pid = self.process.pid
-            loop = asyncio.get_event_loop()
-
-            # Run synchronous process killing in a thread to avoid blocking
-            await loop.run_in_executor(None, self._kill_process_tree, pid)
+        logger.info(
+            f"Stopping runner {self.runner_name} (current model: {current_alias})"
+        )
 
-            # Poll to update the return code
-            if self.process:
-                self.process.poll()
+        try:
+            loop = asyncio.get_running_loop()
+
+            # Run synchronous process killing in a thread to avoid blocking.
+            # Meanwhile the runner itself is waited for on the loop, which
+            # also reaps it, so its shutdown overlaps with its children's.
+            if kill_tree:
+                await asyncio.gather(
+                    loop.run_in_executor(
+                        self._kill_executor,
+                        self._kill_process_tree,
+                        process.pid,
+                        create_time,
+                    ),
+                    self._wait_for_exit(process),
+                )
+            else:
+                await self._wait_for_exit(process)
 
-            # Get exit code before nullifying process
-            exit_code = (
-                self.process.returncode if self.process is not None else "unknown"
-            )
             logger.info(
-                f"Runner {self.runner_name} stopped with exit code: {exit_code}"
+                f"Runner {self.runner_name} stopped with exit code: {process.returncode}"
             )
+            success = True
+        except Exception as e:
+            logger.error(f"Failed to stop runner {self.runner_name}: {e}")
+            success = False
+
+        # Release the stopped process's state in one step, unless a concurrent
+        # caller has already replaced or released it
+        if self.process is process:
+            self._release_process()
+        self.last_ready_ts = None
+        # Reset auto-unload state
+        self.last_activity_ts = None
+        self.active_requests = 0
 
-            # Close log file
-            if self.output_file is not None:
-                try:
-                    self.output_file.close()
-                except Exception:
-                    pass
-                self.output_file = None
+        if success:
+            # Wait to offload GPU memory
+            await asyncio.sleep(0.5)
 
-            self.process = None
-            self.current_model = None  # Reset current model
+        return success
 
-            # Reset auto-unload state
-            self.last_activity_ts = None
-            self.active_requests = 0
+    def _release_process(self):
+        """Drop the runner's process, log file and current model together."""
+        output_file = self.output_file
+        self.process = None
+        self.process_create_time = None
+        self.output_file = None
+        self.current_model = None
+        self.current_model_alias = None
 
-            # Wait to offload GPU memory
-            await asyncio.sleep(0.5)
+        # Close log file
+        if output_file is not None:
+            try:
+                output_file.close()
+            except Exception:
+                pass
 
-            return True
+    async def _wait_for_exit(self, process):
+        """Wait for a stopping runner process to exit.
 
-        except Exception as e:
-            logger.error(f"Failed to stop runner {self.runner_name}: {e}")
-            # Ensure cleanup even if there was an error
-            if self.output_file is not None:
-                try:
-                    self.output_file.close()
-                except Exception:
-                    pass
-                self.output_file = None
-            self.process = None
-            self.current_model = None
-            # Reset auto-unload state
-            self.last_activity_ts = None
-            self.active_requests = 0
-            return False
+        The process is killed if it has not exited within
+        PROCESS_STOP_TIMEOUT_SECONDS.
+
+        Args:
+            process: The runner's asyncio subprocess.
+        """
+        try:
+            await asyncio.wait_for(process.wait(), timeout=PROCESS_STOP_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
 
     async def is_running(self):
         """Check if the runner process is running.
@@ -472,25 +739,12 @@ class RunnerProcess:
             return False
 
         # Check if process is still running
-        if self.process.poll() is not None:
-            current_alias = (
-                self.current_model.get(
-                    "model_alias", os.path.basename(self.current_model["model"])
-                )
-                if self.current_model
-                else "unknown"
-            )
+        if self.process.returncode is not None:
+            current_alias = self.current_model_alias or "unknown"
             logger.warning(
                 f"Runner {self.runner_name} has exited with code: {self.process.returncode} (was running model: {current_alias})"
             )
-            self.process = None
-            self.current_model = None  # Reset current model
-
-            # Close log file
-            if self.output_file is not None:
-                self.output_file.close()
-                self.output_file = None
-
+            self._release_process()
             return False
 
         return True
@@ -573,19 +827,18 @@ class RunnerProcess:
             except Exception:
                 inherit = True
 
-        base_env = os.environ.copy() if inherit else {}
-        merged: dict[str, str] = dict(base_env)
+        merged: dict[str, str] = os.environ.copy() if inherit else {}
 
-        # Apply environment variables in precedence order
+        # Apply environment variables in precedence order. Only configured
+        # values can be non-strings; os.environ and env_from_path never are.
         for mapping in (
             self.runner_config.get("env", {}),
             model_config.get("env", {}),
-            env_from_path,
         ):
             if not isinstance(mapping, dict):
                 continue
-            for key, value in mapping.items():
-                merged[str(key)] = str(value)
+            merged.update({str(key): str(value) for key, value in mapping.items()})
+        merged.update(env_from_path)
 
         return merged
 
@@ -600,10 +853,20 @@ class RunnerProcess:
         Returns:
             A tuple of (command_list, env_from_path).
         """
-        # Parse runner path for environment variables and executable
-        executable, initial_args, env_from_path = self._parse_runner_path_with_env(
-            self.runner_config["path"]
-        )
+        # The result only depends on the runner and model configurations,
+        # which do not change for the lifetime of this runner
+        cached = self._command_cache.get(id(model_config))
+        if cached is not None and cached[0] is model_config:
+            return list(cached[1]), dict(cached[2])
+
+        # Parse runner path for environment variables and executable; the path
+        # is fixed per runner, so it is only parsed once
+        if self._parsed_path is None:
+            self._parsed_path = self._parse_runner_path_with_env(
+                self.runner_config["path"]
+            )
+        executable, initial_args, env_from_path = self._parsed_path
+        env_from_path = dict(env_from_path)
 
         # Start with executable and any initial args from path
         cmd: list[str] = [executable]
@@ -611,165 +874,31 @@ class RunnerProcess:
             cmd.extend(initial_args)
 
         logger.debug(
-            f"Command building for {self.runner_name}: Starting with {len(cmd)} items"
+            "Command building for %s: Starting with %d items",
+            self.runner_name,
+            len(cmd),
         )
 
         # Add model path
         cmd.extend(["--model", model_config["model"]])
-        logger.debug(f"Command building: After model, {len(cmd)} items: {cmd[-2:]}")
+        logger.debug("Command building: After model, %d items", len(cmd))
 
         # Add host and port
         cmd.extend(["--host", self.host, "--port", str(self.port)])
-        logger.debug(f"Command building: After host/port, {len(cmd)} items: {cmd[-4:]}")
+        logger.debug("Command building: After host/port, %d items", len(cmd))
 
         # Add model parameters
-        if "mmproj" in model_config:
-            cmd.extend(["--mmproj", model_config["mmproj"]])
-            logger.debug(
-                f"Command building: After mmproj, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if "model_alias" in model_config:
-            cmd.extend(["--alias", model_config["model_alias"]])
-            logger.debug(f"Command building: After alias, {len(cmd)} items: {cmd[-2:]}")
-
-        if "n_ctx" in model_config:
-            cmd.extend(["--ctx-size", str(model_config["n_ctx"])])
-            logger.debug(f"Command building: After n_ctx, {len(cmd)} items: {cmd[-2:]}")
-
-        if "n_batch" in model_config:
-            cmd.extend(["--batch-size", str(model_config["n_batch"])])
-            logger.debug(
-                f"Command building: After n_batch, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if "u_batch" in model_config:
-            cmd.extend(["--ubatch-size", str(model_config["u_batch"])])
-            logger.debug(
-                f"Command building: After u_batch, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if "n_threads" in model_config:
-            cmd.extend(["--threads", str(model_config["n_threads"])])
-            logger.debug(
-                f"Command building: After n_threads, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if "chat_template" in model_config:
-            cmd.extend(["--chat-template", model_config["chat_template"]])
-            logger.debug(
-                f"Command building: After chat_template, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if "split_mode" in model_config:
-            split_mode_val = model_config["split_mode"]
-            logger.debug(
-                f"Command building: split_mode value is {split_mode_val} (type: {type(split_mode_val)})"
-            )
-            cmd.extend(["--split-mode", split_mode_val])
-            logger.debug(
-                f"Command building: After split_mode, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if model_config.get("embedding", False):
-            cmd.extend(["--embedding"])
-            logger.debug(
-                f"Command building: After embedding, {len(cmd)} items: {cmd[-1:]}"
-            )
-
-        if model_config.get("reranking", False):
-            cmd.extend(["--reranking"])
-            logger.debug(
-                f"Command building: After reranking, {len(cmd)} items: {cmd[-1:]}"
-            )
-
-        if not model_config.get("offload_kqv", True):
-            cmd.append("--no-kv-offload")
-            logger.debug(
-                f"Command building: After no-kv-offload, {len(cmd)} items: {cmd[-1:]}"
-            )
-
-        if model_config.get("jinja", False):
-            cmd.append("--jinja")
-            logger.debug(f"Command building: After jinja, {len(cmd)} items: {cmd[-1:]}")
-
-        if "pooling" in model_config:
-            cmd.extend(["--pooling", model_config["pooling"]])
-            logger.debug(
-                f"Command building: After pooling, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if "flash_attn" in model_config:
-            cmd.extend(["--flash-attn", model_config["flash_attn"]])
-            logger.debug(
-                f"Command building: After flash_attn, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if model_config.get("use_mlock", False):
-            cmd.append("--mlock")
-            logger.debug(
-                f"Command building: After use_mlock, {len(cmd)} items: {cmd[-1:]}"
-            )
-
-        if "main_gpu" in model_config:
-            cmd.extend(["--main-gpu", str(model_config["main_gpu"])])
-            logger.debug(
-                f"Command building: After main_gpu, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if "tensor_split" in model_config:
-            cmd.extend(
-                ["--tensor-split", ",".join(map(str, model_config["tensor_split"]))]
-            )
-            logger.debug(
-                f"Command building: After tensor_split, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if "n_gpu_layers" in model_config:
-            cmd.extend(["--n-gpu-layers", str(model_config["n_gpu_layers"])])
-            logger.debug(
-                f"Command building: After n_gpu_layers, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        # Handle cache type parameters (config uses hyphens)
-        if "cache-type-k" in model_config:
-            cache_k_val = model_config["cache-type-k"]
-            logger.debug(
-                f"Command building: cache-type-k value is {cache_k_val} (type: {type(cache_k_val)})"
-            )
-            cmd.extend(["--cache-type-k", cache_k_val])
-            logger.debug(
-                f"Command building: After cache-type-k, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if "cache-type-v" in model_config:
-            cache_v_val = model_config["cache-type-v"]
-            logger.debug(
-                f"Command building: cache-type-v value is {cache_v_val} (type: {type(cache_v_val)})"
-            )
-            cmd.extend(["--cache-type-v", cache_v_val])
-            logger.debug(
-                f"Command building: After cache-type-v, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        # Handle rope scaling parameters
-        if "rope-scaling" in model_config:
-            cmd.extend(["--rope-scaling", str(model_config["rope-scaling"])])
-            logger.debug(
-                f"Command building: After rope-scaling, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if "rope-scale" in model_config:
-            cmd.extend(["--rope-scale", str(model_config["rope-scale"])])
-            logger.debug(
-                f"Command building: After rope-scale, {len(cmd)} items: {cmd[-2:]}"
-            )
-
-        if "yarn-orig-ctx" in model_config:
-            cmd.extend(["--yarn-orig-ctx", str(model_config["yarn-orig-ctx"])])
-            logger.debug(
-                f"Command building: After yarn-orig-ctx, {len(cmd)} items: {cmd[-2:]}"
-            )
+        for key, flag, kind in _MODEL_CLI_FLAGS:
+            if key not in model_config:
+                continue
+            value = model_config[key]
+            if kind == "value":
+                cmd.extend((flag, str(value)))
+            elif kind == "list":
+                cmd.extend((flag, ",".join(map(str, value))))
+            elif bool(value) == (kind == "flag"):
+                cmd.append(flag)
+        logger.debug("Command building: After model parameters, %d items", len(cmd))
 
         # Add model-specific arguments
         if "args" in model_config and model_config["args"].strip():
@@ -777,7 +906,9 @@ class RunnerProcess:
                 model_args = shlex.split(model_config["args"].strip())
                 cmd.extend(model_args)
                 logger.debug(
-                    f"Command building: After model args, {len(cmd)} items: added {len(model_args)} args"
+                    "Command building: After model args, %d items: added %d args",
+                    len(cmd),
+                    len(model_args),
                 )
             except ValueError as e:
                 logger.error(
@@ -788,13 +919,16 @@ class RunnerProcess:
                 model_args = model_config["args"].strip().split()
                 cmd.extend(model_args)
                 logger.debug(
-                    f"Command building: Using fallback split, {len(cmd)} items: added {len(model_args)} args"
+                    "Command building: Using fallback split, %d items: added %d args",
+                    len(cmd),
+                    len(model_args),
                 )
 
         # Add extra arguments
         cmd.extend(self.runner_config.get("extra_args", []))
 
-        return cmd, env_from_path
+        self._command_cache[id(model_config)] = (model_config, cmd, env_from_path)
+        return list(cmd), dict(env_from_path)
 
     def _build_command(self, model_config):
         """Build the command to start the runner process.
@@ -808,29 +942,52 @@ class RunnerProcess:
         cmd, _ = self._build_command_and_env(model_config)
         return cmd
 
+    async def _wait_for_server_ready(self, timeout):
+        """Probe the server until it accepts connections or the timeout expires.
+
+        Probes start READINESS_BACKOFF_INITIAL_SECONDS apart and back off
+        exponentially to READINESS_BACKOFF_MAX_SECONDS.
+
+        Args:
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            True if the server became ready, False if the timeout expired.
+        """
+        deadline = time.monotonic() + timeout
+        delay = READINESS_BACKOFF_INITIAL_SECONDS
+        while True:
+            if await self._is_server_ready():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, READINESS_BACKOFF_MAX_SECONDS)
+
     async def _is_server_ready(self):
         """Check if the server is ready to accept connections.
 
         Returns:
             True if the server is ready, False otherwise.
         """
-        loop = asyncio.get_event_loop()
-
-        def check_socket():
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.settimeout(1)
-                    s.connect((self.host, self.port))
-                    return True
-            except (socket.timeout, ConnectionRefusedError):
-                return False
-            except Exception as e:
-                logger.error(f"Error checking server readiness: {e}")
-                return False
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                timeout=SERVER_READY_CONNECT_TIMEOUT_SECONDS,
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        except Exception as e:
+            logger.error(f"Error checking server readiness: {e}")
+            return False
 
-        # Run socket check in a thread to avoid blocking
-        with ThreadPoolExecutor() as executor:
-            return await loop.run_in_executor(executor, check_socket)
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
 
 
 class RunnerManager:
@@ -845,16 +1002,41 @@ class RunnerManager:
         """
         self.config_manager = config_manager
         self.session_log_dir = session_log_dir or "logs"
+        os.makedirs(self.session_log_dir, exist_ok=True)
         self.runners = {}  # Map of runner name to RunnerProcess
         self.model_runner_map = {}  # Map of model alias to runner name
+        # Read-only live view of model_runner_map handed out to callers
+        self._model_runner_view = MappingProxyType(self.model_runner_map)
+        self.runner_names_set = frozenset()  # Runner names, for O(1) lookups
+        self.runner_by_model = {}  # Map of model alias to RunnerProcess
         self.timeout = (
             config_manager.get_request_timeout_seconds()
         )  # Configurable timeout
 
+        # Settings read on every request or start; the configuration does not
+        # change while the manager is alive, so they are looked up once here
+        self._auto_start = config_manager.get_auto_start_runners()
+        self._max_parallel_starts = config_manager.get_max_parallel_starts()
+        self._retry_enabled = config_manager.get_retry_on_model_loading()
+        self._max_retries = config_manager.get_max_retries()
+        self._base_delay = config_manager.get_base_delay_seconds()
+        self._max_delay = config_manager.get_max_delay_seconds()
+
+        # Pooled HTTP session for readiness checks and forwarded requests,
+        # created on first use since it needs a running event loop
+        self._http_session = None
+
         # Auto-unload watchdog
         self._auto_unload_task = None
         self._watchdog_running = False
 
+        # Dedicated threads for killing runner process trees, so shutdowns are
+        # not queued behind other work on the loop's default executor
+        self._kill_executor = ThreadPoolExecutor(
+            max_workers=max(1, len(config_manager.get_runner_names())),
+            thread_name_prefix="flexllama-kill",
+        )
+
         self._initialize_runners()
 
     def _initialize_runners(self):
@@ -865,22 +1047,34 @@ class RunnerManager:
             host = self.config_manager.get_runner_host(runner_name)
             port = self.config_manager.get_runner_port(runner_name)
             self.runners[runner_name] = RunnerProcess(
-                runner_name, runner_config, host, port, self.session_log_dir
+                runner_name,
+                runner_config,
+                host,
+                port,
+                self.session_log_dir,
+                self._kill_executor,
             )
 
         # Assign models to runners
         for model in self.config_manager.get_config()["models"]:
-            model_alias = model.get("model_alias", os.path.basename(model["model"]))
             runner_name = model["runner"]
 
             if runner_name in self.runners:
-                self.runners[runner_name].add_model(model)
+                model_alias = self.runners[runner_name].add_model(model)
                 self.model_runner_map[model_alias] = runner_name
+                self.runner_by_model[model_alias] = self.runners[runner_name]
             else:
                 logger.error(
-                    f"Model {model_alias} references unknown runner {runner_name}"
+                    f"Model {_resolve_model_alias(model)} references unknown "
+                    f"runner {runner_name}"
                 )
 
+        self.runner_names_set = frozenset(self.runners)
+        # Runners and models are fixed from here on, so the getters can hand
+        # out the same immutable sequences on every call
+        self._runner_names = tuple(self.runners)
+        self._model_aliases = tuple(self.model_runner_map)
+
     async def start_runner(self, runner_name):
         """Start a runner process.
 
@@ -908,13 +1102,11 @@ class RunnerManager:
         Returns:
             True if the runner was started/switched successfully, False otherwise.
         """
-        if model_alias not in self.model_runner_map:
+        runner = self.runner_by_model.get(model_alias)
+        if runner is None:
             logger.error(f"Unknown model: {model_alias}")
             return False
 
-        runner_name = self.model_runner_map[model_alias]
-        runner = self.runners[runner_name]
-
         return await runner.start_with_model(model_alias)
 
     async def stop_runner(self, runner_name):
@@ -933,54 +1125,134 @@ class RunnerManager:
         return await self.runners[runner_name].stop()
 
     async def stop_all_runners(self):
-        """Stop all runner processes.
+        """Stop all runner processes concurrently.
 
         Returns:
             True if all runners were stopped successfully, False otherwise.
         """
-        success = True
-        for runner_name in self.runners:
-            if not await self.stop_runner(runner_name):
-                success = False
+        kill_tree = True
+        if os.name == "nt":
+            # taskkill accepts several PIDs, so kill every runner's tree with
+            # one process instead of spawning a taskkill per runner
+            pids = [
+                runner.process.pid
+                for runner in self.runners.values()
+                if runner.process is not None
+                and runner.process.returncode is None
+                and _get_process(runner.process.pid, runner.process_create_time)
+                is not None
+            ]
+            if pids:
+                loop = asyncio.get_running_loop()
+                kill_tree = not await loop.run_in_executor(
+                    self._kill_executor, _run_taskkill, pids
+                )
+
+        results = await asyncio.gather(
+            *(runner.stop(kill_tree) for runner in list(self.runners.values())),
+            return_exceptions=True,
+        )
+        return all(result is True for result in results)
+
+    async def shutdown(self):
+        """Stop all runner processes and release the manager's resources.
+
+        Returns:
+            True if all runners were stopped successfully, False otherwise.
+        """
+        success = await self.stop_all_runners()
+        await self.close()
+        self._kill_executor.shutdown(wait=False)
         return success
 
+    async def _get_http_session(self):
+        """Get the pooled HTTP session used to talk to the runners.
+
+        Returns:
+            The shared aiohttp.ClientSession, created on first use.
+        """
+        if self._http_session is None or self._http_session.closed:
+            # No connection cap: slow forwards may hold connections for the
+            # whole request timeout and readiness probes must never queue
+            # behind them; the pool is only here for keep-alive reuse
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, keepalive_timeout=60)
+            )
+        return self._http_session
+
+    async def close(self):
+        """Close the pooled HTTP session, if one was opened."""
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
     async def auto_start_default_runners(self):
         """Auto-start runners with their first model if enabled in configuration.
 
         Returns:
             True if all auto-starts were successful, False otherwise.
         """
-        if not self.config_manager.get_auto_start_runners():
+        if not self._auto_start:
             logger.info("Auto-start is disabled, skipping runner auto-start")
             return True
 
         logger.info("Auto-starting default runners...")
-        success = True
-        started_count = 0
 
+        runner_names = []
         for runner_name in self.get_runner_names():
             runner = self.runners[runner_name]
             if runner.models:  # If runner has models assigned
-                logger.info(
-                    f"Auto-starting runner {runner_name} with model {runner.models[0].get('model_alias', 'unknown')}"
+                logger.debug(
+                    "Auto-starting runner %s with model %s",
+                    runner_name,
+                    runner.model_aliases[0],
                 )
-                if await self.start_runner(runner_name):
-                    started_count += 1
-                    logger.info(f"Successfully auto-started runner {runner_name}")
-                else:
-                    logger.error(f"Failed to auto-start runner {runner_name}")
-                    success = False
+                runner_names.append(runner_name)
             else:
                 logger.warning(
                     f"Runner {runner_name} has no models assigned, skipping auto-start"
                 )
 
-        if success and started_count > 0:
-            logger.info(f"Successfully auto-started {started_count} runners")
-        elif started_count == 0:
+        # Each runner has its own port, so runners start concurrently, up to
+        # max_parallel_starts at a time
+        start_semaphore = asyncio.Semaphore(
+            self._max_parallel_starts or max(1, len(runner_names))
+        )
+
+        durations = {}
+
+        async def _auto_start(runner_name):
+            async with start_semaphore:
+                start_time = time.monotonic()
+                try:
+                    return await self.start_runner(runner_name)
+                finally:
+                    durations[runner_name] = time.monotonic() - start_time
+
+        results = await asyncio.gather(
+            *(_auto_start(runner_name) for runner_name in runner_names),
+            return_exceptions=True,
+        )
+
+        # Failures are logged individually; successes go into one summary line
+        started = []
+        for runner_name, result in zip(runner_names, results):
+            if result is True:
+                started.append(f"{runner_name} ({durations[runner_name]:.1f}s)")
+            elif isinstance(result, Exception):
+                logger.error(f"Error auto-starting runner {runner_name}: {result}")
+            else:
+                logger.error(f"Failed to auto-start runner {runner_name}")
+
+        if started:
+            logger.info(
+                f"Auto-started {len(started)}/{len(runner_names)} runners: "
+                f"{', '.join(started)}"
+            )
+        elif not runner_names:
             logger.info("No runners were auto-started (no models assigned)")
 
-        return success
+        return len(started) == len(runner_names)
 
     async def start_auto_unload_watchdog(self) -> None:
         """Start the auto-unload watchdog task."""
@@ -1023,10 +1295,7 @@ class RunnerManager:
                                 and (current_time - runner.last_activity_ts)
                                 >= runner.auto_unload_timeout_seconds
                             ):
-                                current_alias = runner.current_model.get(
-                                    "model_alias",
-                                    os.path.basename(runner.current_model["model"]),
-                                )
+                                current_alias = runner.current_model_alias
                                 logger.info(
                                     f"Auto-unload triggered for runner {runner_name} "
                                     f"(model: {current_alias}) after {runner.auto_unload_timeout_seconds}s idle"
@@ -1053,6 +1322,20 @@ class RunnerManager:
 
         return await self.runners[runner_name].is_running()
 
+    async def snapshot_running(self):
+        """Check which runner processes are running in a single pass.
+
+        Runner exit status is tracked by the event loop, so each check is an
+        attribute read and the runners are simply checked in turn.
+
+        Returns:
+            A dictionary mapping each runner name to whether it is running.
+        """
+        return {
+            runner_name: await runner.is_running()
+            for runner_name, runner in self.runners.items()
+        }
+
     async def is_model_available(self, model_alias):
         """Check if a model is available (loaded and running).
 
@@ -1062,15 +1345,13 @@ class RunnerManager:
         Returns:
             True if the model is loaded and running, False otherwise.
         """
-        if model_alias not in self.model_runner_map:
+        runner = self.runner_by_model.get(model_alias)
+        if runner is None:
             logger.error(f"Unknown model: {model_alias}")
             return False
 
-        runner_name = self.model_runner_map[model_alias]
-        runner = self.runners[runner_name]
-
         # Check if runner is running and has the specific model loaded
-        if not await self.is_runner_running(runner_name):
+        if not await runner.is_running():
             return False
 
         return runner.is_model_loaded(model_alias)
@@ -1084,12 +1365,10 @@ class RunnerManager:
         Returns:
             The runner process, or None if not found.
         """
-        if model_alias not in self.model_runner_map:
+        runner = self.runner_by_model.get(model_alias)
+        if runner is None:
             logger.error(f"Unknown model: {model_alias}")
-            return None
-
-        runner_name = self.model_runner_map[model_alias]
-        return self.runners.get(runner_name)
+        return runner
 
     def get_port_for_model(self, model_alias):
         """Get the port for a model.
@@ -1110,25 +1389,26 @@ class RunnerManager:
         """Get all model aliases.
 
         Returns:
-            A list of all model aliases.
+            A tuple of all model aliases.
         """
-        return list(self.model_runner_map.keys())
+        return self._model_aliases
 
     def get_runner_names(self):
         """Get all runner names.
 
         Returns:
-            A list of all runner names.
+            A tuple of all runner names.
         """
-        return list(self.runners.keys())
+        return self._runner_names
 
     def get_model_runner_map(self):
         """Get the model-to-runner mapping.
 
         Returns:
-            A dictionary mapping model aliases to runner names.
+            A read-only mapping of model aliases to runner names. It is a live
+            view rather than a copy; use dict() on it for a mutable snapshot.
         """
-        return self.model_runner_map.copy()
+        return self._model_runner_view
 
     async def get_current_model_for_runner(self, runner_name):
         """Get the currently loaded model for a runner.
@@ -1147,9 +1427,7 @@ class RunnerManager:
         if runner.current_model is None:
             return None
 
-        return runner.current_model.get(
-            "model_alias", os.path.basename(runner.current_model["model"])
-        )
+        return runner.current_model_alias
 
     async def switch_model(self, from_model_alias, to_model_alias):
         """Switch from one model to another on the same runner.
@@ -1163,20 +1441,19 @@ class RunnerManager:
             True if the switch was successful, False otherwise.
         """
         # Check if both models exist and are on the same runner
-        if from_model_alias not in self.model_runner_map:
+        from_runner = self.runner_by_model.get(from_model_alias)
+        if from_runner is None:
             logger.error(f"Unknown source model: {from_model_alias}")
             return False
 
-        if to_model_alias not in self.model_runner_map:
+        to_runner = self.runner_by_model.get(to_model_alias)
+        if to_runner is None:
             logger.error(f"Unknown target model: {to_model_alias}")
             return False
 
-        from_runner = self.model_runner_map[from_model_alias]
-        to_runner = self.model_runner_map[to_model_alias]
-
-        if from_runner != to_runner:
+        if from_runner is not to_runner:
             logger.error(
-                f"Models {from_model_alias} and {to_model_alias} are on different runners ({from_runner} vs {to_runner})"
+                f"Models {from_model_alias} and {to_model_alias} are on different runners ({from_runner.runner_name} vs {to_runner.runner_name})"
             )
             return False
 
@@ -1190,15 +1467,13 @@ class RunnerManager:
             A dictionary with runner status information.
         """
         status = {}
+        running = await self.snapshot_running()
 
         for runner_name, runner in self.runners.items():
             runner_status = {
-                "is_running": await runner.is_running(),
-                "current_model": await self.get_current_model_for_runner(runner_name),
-                "available_models": [
-                    model.get("model_alias", os.path.basename(model["model"]))
-                    for model in runner.models
-                ],
+                "is_running": running[runner_name],
+                "current_model": runner.current_model_alias,
+                "available_models": list(runner.model_aliases),
                 "host": runner.host,
                 "port": runner.port,
             }
@@ -1215,7 +1490,7 @@ class RunnerManager:
         Returns:
             Tuple of (success: bool, error_message: str or None)
         """
-        if not self.config_manager.get_retry_on_model_loading():
+        if not self._retry_enabled:
             # Retry disabled, use single attempt to ensure model is ready
             if not await self.is_model_available(model_alias):
                 logger.info(f"Starting runner for model {model_alias}")
@@ -1223,14 +1498,14 @@ class RunnerManager:
                     return False, f"Failed to start model: {model_alias}"
 
             # Wait a bit for model to be fully ready
-            await self._wait_for_model_readiness(model_alias, max_wait_seconds=30)
-            is_ready, error = await self._check_model_readiness(model_alias)
-            return is_ready, error
+            return await self._wait_for_model_readiness(
+                model_alias, max_wait_seconds=30
+            )
 
         # Retry enabled - do pre-flight readiness checks with exponential backoff
-        max_retries = self.config_manager.get_max_retries()
-        base_delay = self.config_manager.get_base_delay_seconds()
-        max_delay = self.config_manager.get_max_delay_seconds()
+        max_retries = self._max_retries
+        base_delay = self._base_delay
+        max_delay = self._max_delay
 
         last_error = None
 
@@ -1265,20 +1540,18 @@ class RunnerManager:
                 if not await self.start_runner_for_model(model_alias):
                     return False, f"Failed to start model: {model_alias}"
 
-            # Wait for the newly started model to become ready
-            logger.debug(
-                f"Waiting for newly started model {model_alias} to become ready"
+            # Wait for the model to become ready; the wait's last health check
+            # doubles as the pre-flight readiness check
+            logger.debug("Waiting for model %s to become ready", model_alias)
+            is_ready, readiness_error = await self._wait_for_model_readiness(
+                model_alias, max_wait_seconds=30
             )
-            await self._wait_for_model_readiness(model_alias, max_wait_seconds=30)
-
-            # Do a pre-flight readiness check
-            is_ready, readiness_error = await self._check_model_readiness(model_alias)
             if not is_ready:
                 logger.info(f"Model {model_alias} not ready: {readiness_error}")
                 return False, f"Model not ready: {readiness_error}"
 
             # Model is ready
-            logger.debug(f"Model {model_alias} is ready")
+            logger.debug("Model %s is ready", model_alias)
             return True, None
 
         except Exception as e:
@@ -1300,73 +1573,88 @@ class RunnerManager:
             if runner is None:
                 return False, HealthMessages.NO_RUNNER_AVAILABLE
 
-            # Build health check URL
-            health_url = f"http://{runner.host}:{runner.port}/health"
+            health_url = runner.health_url
 
             # Make a quick health check request
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.get(
-                        health_url, timeout=aiohttp.ClientTimeout(total=5)
-                    ) as response:
-                        if response.status == 200:
-                            return True, None
-                        elif response.status == 503:
-                            # Parse the error response for loading status
-                            try:
-                                error_data = await response.json()
-                                error_message = error_data.get("error", {}).get(
-                                    "message", "Unknown error"
-                                )
-                                if HealthStatus.LOADING in error_message.lower():
-                                    return False, HealthMessages.MODEL_LOADING
-                                else:
-                                    return False, error_message
-                            except (json.JSONDecodeError, aiohttp.ContentTypeError):
-                                # Fallback if JSON parsing fails
-                                response_text = await response.text()
-                                if HealthStatus.LOADING in response_text.lower():
-                                    return False, HealthMessages.MODEL_LOADING
-                                return (
-                                    False,
-                                    f"HTTP {response.status}: {response_text[:100]}",
-                                )
-                        else:
-                            response_text = (
-                                await response.text()
-                                if response.content_type != "application/json"
-                                else str(await response.json())
+            session = await self._get_http_session()
+            try:
+                async with session.get(
+                    health_url, timeout=aiohttp.ClientTimeout(total=5)
+                ) as response:
+                    if response.status == 200:
+                        runner.last_ready_ts = time.monotonic()
+                        return True, None
+                    body = await response.read()
+                    if response.status == 503:
+                        # Parse the error response for loading status
+                        try:
+                            error_data = json_loads(body)
+                            error_message = error_data.get("error", {}).get(
+                                "message", "Unknown error"
                             )
+                            if HealthStatus.LOADING in error_message.lower():
+                                return False, HealthMessages.MODEL_LOADING
+                            else:
+                                return False, error_message
+                        except (json.JSONDecodeError, AttributeError):
+                            # Fallback if JSON parsing fails
+                            response_text = body.decode("utf-8", "replace")
+                            if HealthStatus.LOADING in response_text.lower():
+                                return False, HealthMessages.MODEL_LOADING
                             return (
                                 False,
-                                f"Health check failed with status {response.status}: {response_text[:100]}",
+                                f"HTTP {response.status}: {response_text[:100]}",
                             )
-                except asyncio.TimeoutError:
-                    return False, HealthMessages.HEALTH_CHECK_TIMEOUT
-                except aiohttp.ClientError as e:
-                    return False, f"{HealthMessages.CONNECTION_ERROR}: {str(e)}"
+                    else:
+                        response_text = body.decode("utf-8", "replace")
+                        if response.content_type == "application/json":
+                            try:
+                                response_text = str(json_loads(body))
+                            except json.JSONDecodeError:
+                                pass
+                        return (
+                            False,
+                            f"Health check failed with status {response.status}: {response_text[:100]}",
+                        )
+            except asyncio.TimeoutError:
+                return False, HealthMessages.HEALTH_CHECK_TIMEOUT
+            except aiohttp.ClientError as e:
+                return False, f"{HealthMessages.CONNECTION_ERROR}: {str(e)}"
         except Exception as e:
             return False, f"{HealthMessages.HEALTH_CHECK_FAILED}: {str(e)}"
 
     async def _wait_for_model_readiness(self, model_alias, max_wait_seconds=10):
-        """Wait for a model to become ready, with a simple polling approach.
+        """Wait for a model to become ready by polling its health endpoint.
+
+        The model is always checked at least once. Polls start
+        MODEL_READY_POLL_INITIAL_SECONDS apart and back off to
+        MODEL_READY_POLL_MAX_SECONDS, so a model that is nearly ready is
+        noticed quickly while a long load is not polled continuously.
 
         Args:
             model_alias: The model alias to wait for.
             max_wait_seconds: Maximum time to wait in seconds.
+
+        Returns:
+            Tuple of (is_ready: bool, error_message: str or None) from the
+            last readiness check.
         """
-        start_time = asyncio.get_event_loop().time()
-        while (asyncio.get_event_loop().time() - start_time) < max_wait_seconds:
-            is_ready, _ = await self._check_model_readiness(model_alias)
+        start_time = time.monotonic()
+        delay = MODEL_READY_POLL_INITIAL_SECONDS
+        while True:
+            is_ready, error = await self._check_model_readiness(model_alias)
+            elapsed = time.monotonic() - start_time
             if is_ready:
-                logger.debug(
-                    f"Model {model_alias} became ready after {asyncio.get_event_loop().time() - start_time:.1f}s"
-                )
-                return
-            await asyncio.sleep(0.5)
+                logger.debug("Model %s became ready after %.1fs", model_alias, elapsed)
+                return True, None
+            if elapsed >= max_wait_seconds:
+                break
+            await asyncio.sleep(min(delay, max_wait_seconds - elapsed))
+            delay = min(delay * 1.5, MODEL_READY_POLL_MAX_SECONDS)
         logger.warning(
             f"Model {model_alias} did not become ready within {max_wait_seconds}s"
         )
+        return False, error
 
     async def forward_request(self, model_alias, endpoint, request_data):
         """Forward a request to a model's runner (assumes model is already ready).
@@ -1379,17 +1667,39 @@ class RunnerManager:
         Returns:
             Tuple of (success: bool, response_data: dict, status_code: int)
         """
+        status_code, body = await self.forward_request_raw(
+            model_alias, endpoint, request_data
+        )
+        try:
+            response_data = json_loads(body)
+        except json.JSONDecodeError:
+            response_text = body.decode("utf-8", errors="replace")
+            response_data = {"error": {"message": f"Invalid response: {response_text}"}}
+        return status_code == 200, response_data, status_code
+
+    async def forward_request_raw(self, model_alias, endpoint, request_data):
+        """Forward a request to a model's runner and return the encoded response.
+
+        JSON responses are relayed byte for byte rather than re-encoded, so
+        large completions are only held in memory once. They are still parsed
+        once to make sure the runner returned a valid document.
+
+        Args:
+            model_alias: Alias of the model to forward to.
+            endpoint: API endpoint to forward to (e.g., "/v1/chat/completions").
+            request_data: The request data to forward.
+
+        Returns:
+            Tuple of (status_code: int, body: bytes), where body is a JSON
+            document.
+        """
         # Get runner for model
         runner = self.get_runner_for_model(model_alias)
         if runner is None:
-            return (
-                False,
-                {"error": {"message": f"Model not available: {model_alias}"}},
-                500,
-            )
+            return 500, _error_body(f"Model not available: {model_alias}")
 
         # Build URL
-        url = f"http://{runner.host}:{runner.port}{endpoint}"
+        url = f"{runner.base_url}{endpoint}"
 
         # If timeout is 0, disable all timeouts; otherwise set explicit values
         if self.timeout == 0:
@@ -1403,32 +1713,44 @@ class RunnerManager:
             )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=request_data,
-                    timeout=timeout_config,
-                ) as response:
+            session = await self._get_http_session()
+            # Encode the body with the fast encoder rather than aiohttp's
+            # json= argument, which always goes through the stdlib encoder
+            async with session.post(
+                url,
+                data=json_dumps(request_data),
+                headers=UPSTREAM_JSON_HEADERS,
+                timeout=timeout_config,
+            ) as response:
+                body = await response.read()
+                content_type = response.content_type
+                is_json = content_type == "application/json" or content_type.endswith(
+                    "+json"
+                )
+                if is_json:
                     try:
-                        response_data = await response.json()
-                    except (json.JSONDecodeError, aiohttp.ContentTypeError):
-                        # If JSON parsing fails, create error response
-                        response_text = await response.text()
-                        response_data = {
-                            "error": {"message": f"Invalid response: {response_text}"}
-                        }
+                        json_loads(body)
+                    except json.JSONDecodeError:
+                        is_json = False
+
+                if not is_json:
+                    # Not valid JSON, so wrap it in an error response
+                    response_text = body.decode(
+                        response.charset or "utf-8", errors="replace"
+                    )
+                    body = _error_body(f"Invalid response: {response_text}")
 
-                    return response.status == 200, response_data, response.status
+                return response.status, body
 
         except aiohttp.ClientError as e:
             logger.error(f"Client error forwarding to {url}: {e}")
-            return False, {"error": {"message": f"Connection error: {str(e)}"}}, 503
+            return 503, _error_body(f"Connection error: {str(e)}")
         except asyncio.TimeoutError:
             logger.error(f"Timeout forwarding to {url}")
-            return False, {"error": {"message": "Request timeout"}}, 408
+            return 408, _ERROR_REQUEST_TIMEOUT
         except Exception as e:
             logger.error(f"Unexpected error forwarding to {url}: {e}")
-            return False, {"error": {"message": f"Unexpected error: {str(e)}"}}, 500
+            return 500, _error_body(f"Unexpected error: {str(e)}")
 
     async def check_model_health(self, model_alias):
         """Check the health of a specific model by making a health check request.
@@ -1471,10 +1793,10 @@ async def main():
 
         # Wait for user input
         print("Press Enter to stop all runners...")
-        await asyncio.get_event_loop().run_in_executor(None, input)
+        await asyncio.get_running_loop().run_in_executor(None, input)
 
         # Stop all runners
-        if await runner_manager.stop_all_runners():
+        if await runner_manager.shutdown():
             print("All runners stopped successfully")
         else:
             print("Failed to stop all runners")
@@ -9,44 +9,110 @@ import sys
 import signal
 import argparse
 import logging
+import logging.handlers
+import queue
+import atexit
+import importlib
 import asyncio
 import platform
-import uuid
+import secrets
+import time
 import tempfile
 from datetime import datetime
-import json
 
 from backend.config import ConfigManager
 from backend.runner import RunnerManager
 from backend.api import APIServer
+from backend.json_utils import json_dumps
+
+# Whether we are running on Windows, which needs its own signal handling
+IS_WINDOWS = sys.platform == "win32"
 
 # Global session ID for organizing logs
 SESSION_ID = None
 SESSION_LOG_DIR = None
 
+# Background listener that writes queued log records to the log files
+LOG_LISTENER = None
 
-def _get_writable_log_dir() -> str:
-    """
-    Determines and prepares a writable log directory.
+# Buffer size for the log files, so batched records go out in large writes
+LOG_FILE_BUFFER_SIZE = 64 * 1024
 
-    It first checks the 'FLEXLLAMA_LOG_DIR' environment variable,
-    then defaults to 'logs'. If the target directory is not writable,
-    it falls back to a temporary directory.
 
-    Returns:
-        The path to the writable log directory.
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that only renders the date and time once per second.
+
+    Records logged within the same second reuse the rendered timestamp and
+    only the milliseconds are formatted per record.
     """
-    preferred_dir = os.getenv("FLEXLLAMA_LOG_DIR", "logs")
 
-    try:
-        os.makedirs(preferred_dir, mode=0o777, exist_ok=True)
-        if os.access(preferred_dir, os.W_OK):
-            return preferred_dir
-    except OSError:
-        # Fallback will be handled below if creation or access fails
-        pass
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (whole second, rendered timestamp), swapped as one tuple because
+        # the console and file formatters run on different threads
+        self._time_cache = (None, None)
+
+    def formatTime(self, record, datefmt=None):
+        """Return the record's creation time, reusing the last rendered second."""
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, rendered = self._time_cache
+        if cached_second != second:
+            rendered = time.strftime(
+                self.default_time_format, self.converter(record.created)
+            )
+            self._time_cache = (second, rendered)
+        return self.default_msec_format % (rendered, record.msecs)
+
+
+class _BatchedFileHandler(logging.FileHandler):
+    """File handler that leaves flushing to its QueueListener.
+
+    Records are written to the file object's buffer without a flush per
+    record, so a burst of log lines reaches the disk in a few large writes.
+    """
+
+    def _open(self):
+        """Open the log file with a LOG_FILE_BUFFER_SIZE write buffer."""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record):
+        """Write a record to the log file without flushing it."""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _LogFileListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers whenever the queue drains."""
+
+    def handle(self, record):
+        """Handle a record, flushing the handlers if no more are waiting."""
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+def _get_fallback_log_dir() -> str:
+    """
+    Determines the log directory to use when the preferred one is not writable.
 
-    # If we are here, the preferred_dir is not writable.
+    Returns:
+        A per-user directory under the system temporary directory.
+    """
     # Use a cross-platform approach for fallback directory
     temp_base = tempfile.gettempdir()
 
@@ -58,13 +124,54 @@ def _get_writable_log_dir() -> str:
         # On Windows, use username instead
         user_id = os.getenv("USERNAME", "user")
 
-    fallback_dir = os.path.join(temp_base, f"flexllama_logs_{user_id}")
-    print(
-        f"Warning: Log directory '{preferred_dir}' not writable. "
-        f"Falling back to '{fallback_dir}'."
-    )
-    os.makedirs(fallback_dir, exist_ok=True)
-    return fallback_dir
+    return os.path.join(temp_base, f"flexllama_logs_{user_id}")
+
+
+def select_event_loop():
+    """
+    Selects the asyncio event loop implementation.
+
+    The 'FLEXLLAMA_LOOP' environment variable chooses the loop: 'auto' (the
+    default) uses the libuv-based loop for the platform (uvloop on Linux and
+    macOS, winloop on Windows) when it is installed and the standard asyncio
+    loop otherwise, 'uvloop' or 'winloop' requires that loop and warns when
+    it is missing or unsupported on this platform, and 'asyncio' (or
+    'default') always keeps the standard loop.
+
+    Returns:
+        The uvloop or winloop module to run on, or None for the standard
+        asyncio loop.
+    """
+    loop_name = os.getenv("FLEXLLAMA_LOOP", "auto").strip().lower() or "auto"
+
+    if loop_name not in ("auto", "uvloop", "winloop", "asyncio", "default"):
+        print(
+            f"Warning: Unknown FLEXLLAMA_LOOP value '{loop_name}'. "
+            "Falling back to the default asyncio event loop."
+        )
+        return None
+
+    if loop_name in ("asyncio", "default"):
+        return None
+
+    platform_loop = "winloop" if IS_WINDOWS else "uvloop"
+    if loop_name not in ("auto", platform_loop):
+        print(
+            f"Warning: FLEXLLAMA_LOOP={loop_name} is not supported on this "
+            f"platform (use {platform_loop}). "
+            "Falling back to the default asyncio event loop."
+        )
+        return None
+
+    try:
+        return importlib.import_module(platform_loop)
+    except ImportError:
+        if loop_name == platform_loop:
+            print(
+                f"Warning: FLEXLLAMA_LOOP={loop_name} but {loop_name} is not "
+                "installed. Falling back to the default asyncio event loop."
+            )
+        return None
 
 
 def setup_logging(debug: bool = False):
@@ -73,28 +180,43 @@ def setup_logging(debug: bool = False):
     Args:
         debug: Whether to enable debug logging.
     """
-    global SESSION_ID, SESSION_LOG_DIR
+    global SESSION_ID, SESSION_LOG_DIR, LOG_LISTENER
 
     # Generate a unique session ID
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    session_uuid = str(uuid.uuid4())[:8]  # Use first 8 characters of UUID
+    session_uuid = secrets.token_hex(4)  # 8 random hex characters
     SESSION_ID = f"{timestamp}_{session_uuid}"
 
-    # Determine and prepare log directory
-    base_log_dir = _get_writable_log_dir()
-
-    # Create session-specific log directory and store it globally
-    SESSION_LOG_DIR = os.path.join(base_log_dir, SESSION_ID)
-    os.makedirs(SESSION_LOG_DIR, exist_ok=True)
+    # Create session-specific log directory and store it globally. A single
+    # makedirs creates the base directory too; if that fails, the preferred
+    # directory is not writable and a temporary directory is used instead.
+    preferred_dir = os.getenv("FLEXLLAMA_LOG_DIR", "logs")
+    SESSION_LOG_DIR = os.path.join(preferred_dir, SESSION_ID)
+    try:
+        os.makedirs(SESSION_LOG_DIR, exist_ok=True)
+    except OSError:
+        fallback_dir = _get_fallback_log_dir()
+        print(
+            f"Warning: Log directory '{preferred_dir}' not writable. "
+            f"Falling back to '{fallback_dir}'."
+        )
+        SESSION_LOG_DIR = os.path.join(fallback_dir, SESSION_ID)
+        os.makedirs(SESSION_LOG_DIR, exist_ok=True)
 
     # Set logging level
     log_level = logging.DEBUG if debug else logging.INFO
 
+    # Thread and process details are not in any log format, so skip
+    # collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Create formatters
-    console_formatter = logging.Formatter(
+    console_formatter = _CachedTimeFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
-    file_formatter = logging.Formatter(
+    file_formatter = _CachedTimeFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
     )
 
@@ -103,6 +225,10 @@ def setup_logging(debug: bool = False):
     root_logger.handlers.clear()
     root_logger.setLevel(log_level)
 
+    # Without --debug, drop DEBUG calls in Logger.isEnabledFor before any
+    # record is built, whatever level individual loggers are set to
+    logging.disable(logging.NOTSET if debug else logging.DEBUG)
+
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
@@ -111,17 +237,30 @@ def setup_logging(debug: bool = False):
 
     # Create file handler for main application logs
     main_log_file = os.path.join(SESSION_LOG_DIR, "main.log")
-    file_handler = logging.FileHandler(main_log_file, mode="w", encoding="utf-8")
+    file_handler = _BatchedFileHandler(
+        main_log_file, mode="w", encoding="utf-8", delay=True
+    )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
 
-    # Create a file handler for errors only
+    # Create a file handler for errors only; the file is created up front
+    # because the startup log and session info point users at it
     error_log_file = os.path.join(SESSION_LOG_DIR, "errors.log")
-    error_handler = logging.FileHandler(error_log_file, mode="w", encoding="utf-8")
+    error_handler = _BatchedFileHandler(error_log_file, mode="w", encoding="utf-8")
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(file_formatter)
-    root_logger.addHandler(error_handler)
+
+    # The file handlers run on a background thread fed through a queue, so
+    # logging from the event loop never blocks on file writes. Writes are
+    # only flushed once the queue has drained, which batches bursts.
+    stop_log_listener()
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    LOG_LISTENER = _LogFileListener(
+        log_queue, file_handler, error_handler, respect_handler_level=True
+    )
+    LOG_LISTENER.start()
+    atexit.register(stop_log_listener)
 
     # Log the setup
     logger = logging.getLogger(__name__)
@@ -133,6 +272,15 @@ def setup_logging(debug: bool = False):
     logger.info(f"Error log: {error_log_file}")
 
 
+def stop_log_listener():
+    """Write out any queued log records and stop the file logging thread."""
+    global LOG_LISTENER
+
+    if LOG_LISTENER is not None:
+        LOG_LISTENER.stop()
+        LOG_LISTENER = None
+
+
 def get_session_id():
     """Get the current session ID.
 
@@ -179,8 +327,9 @@ def create_session_info(config_file_path):
 
     try:
         session_info_file = os.path.join(session_log_dir, "session_info.json")
-        with open(session_info_file, "w", encoding="utf-8") as f:
-            json.dump(session_info, f, indent=2, ensure_ascii=False)
+        data = json_dumps(session_info, indent=True)
+        with open(session_info_file, "wb") as f:
+            f.write(data)
 
         logger = logging.getLogger(__name__)
         logger.info(f"Session info saved to: {session_info_file}")
@@ -202,6 +351,9 @@ async def main():
     logger = logging.getLogger(__name__)
 
     try:
+        loop_module = type(asyncio.get_running_loop()).__module__
+        logger.info(f"Using event loop: {loop_module.split('.')[0]}")
+
         # Load configuration
         logger.info(f"Loading configuration from {args.config}")
         config_manager = ConfigManager(args.config)
@@ -227,19 +379,30 @@ async def main():
         async def shutdown():
             logger.info("Shutting down...")
             await api_server.stop()
-            await runner_manager.stop_all_runners()
+            await runner_manager.shutdown()
             shutdown_event.set()
 
+        # Only the first signal launches the shutdown; later ones are ignored
+        shutdown_started = False
+
+        def _launch_shutdown():
+            nonlocal shutdown_started
+            if shutdown_started:
+                return
+            shutdown_started = True
+            loop.create_task(shutdown())
+
         # Set up platform-specific signal handling
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             # Windows doesn't support asyncio signal handlers
             logger.info("Running on Windows, using Windows-specific signal handling")
 
-            # Define a sync signal handler that schedules the async shutdown
+            # The proactor loop has no add_reader(), but it already wakes on
+            # signals through its own wakeup fd, so the handler only needs to
+            # hand the shutdown over to the loop thread safely
             def win_signal_handler(sig, frame):
                 logger.info(f"Received signal {sig}")
-                if not shutdown_event.is_set():
-                    asyncio.create_task(shutdown())
+                loop.call_soon_threadsafe(_launch_shutdown)
 
             # Register the sync handler
             signal.signal(signal.SIGINT, win_signal_handler)
@@ -249,7 +412,7 @@ async def main():
             logger.info("Running on Unix-like system, using asyncio signal handlers")
 
             for sig in (signal.SIGINT, signal.SIGTERM):
-                loop.add_signal_handler(sig, lambda: asyncio.create_task(shutdown()))
+                loop.add_signal_handler(sig, _launch_shutdown)
 
         # Start API server
         success = await api_server.start()
@@ -275,8 +438,16 @@ async def main():
 
 def main_entry():
     """Entry point for console script."""
-    asyncio.run(main())
+    loop_module = select_event_loop()
+    if loop_module is None:
+        asyncio.run(main())
+    elif sys.version_info >= (3, 12):
+        # Event loop policies are deprecated, so pass the loop factory directly
+        asyncio.run(main(), loop_factory=loop_module.new_event_loop)
+    else:
+        asyncio.set_event_loop_policy(loop_module.EventLoopPolicy())
+        asyncio.run(main())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main_entry()
@@ -145,6 +145,43 @@ async def test_models_endpoint(base_url):
             return []
 
 
+async def test_models_etag(base_url):
+    """Verify that /v1/models answers a matching If-None-Match with 304.
+
+    Args:
+        base_url: The base URL of the API server.
+
+    Returns:
+        True if the conditional request is handled correctly, False otherwise.
+    """
+    logger.info("Testing /v1/models ETag handling")
+
+    url = f"{base_url}/v1/models"
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession() as session:
+        try:
+            async with session.get(url, timeout=timeout) as response:
+                etag = response.headers.get("ETag")
+            if not etag:
+                logger.error("GET /v1/models did not return an ETag header")
+                return False
+
+            async with session.get(
+                url, headers={"If-None-Match": etag}, timeout=timeout
+            ) as response:
+                if response.status != 304:
+                    logger.error(
+                        f"Expected 304 for matching If-None-Match, got {response.status}"
+                    )
+                    return False
+
+            logger.info(f"ETag {etag} revalidated with 304")
+            return True
+        except Exception as e:
+            logger.error(f"Error testing models ETag: {e}")
+            return False
+
+
 async def test_health_endpoint(base_url):
     """Test the /health endpoint.
 
@@ -511,6 +548,9 @@ async def main():
         if not models:
             logger.error("Failed to get models")
             sys.exit(1)
+        if not await test_models_etag(args.url):
+            logger.error("ETag test for /v1/models failed")
+            sys.exit(1)
 
         # Test health endpoint
         logger.info("=" * 60)